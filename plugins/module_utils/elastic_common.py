@@ -2,14 +2,25 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib  # pylint: disable=unused-import
 
+import binascii
+import hashlib
+import json
+import os
+import re
+import time
 import traceback
 
 elastic_found = False
 E_IMP_ERR = None
 NotFoundError = None
+AuthenticationException = None
 helpers = None
 __version__ = None
 
+# Keep comma joined index names well under the default 4kb
+# http.max_initial_line_length once the rest of the url is added
+MAX_INDEX_NAMES_LENGTH = 3000
+
 try:
     from urllib.parse import urlparse
 except ImportError:
@@ -18,6 +29,7 @@ except ImportError:
 try:
     from elasticsearch import Elasticsearch
     from elasticsearch.exceptions import NotFoundError  # pylint: disable=unused-import
+    from elasticsearch.exceptions import AuthenticationException  # pylint: disable=unused-import
     from elasticsearch import helpers  # pylint: disable=unused-import
     from elasticsearch import __version__  # pylint: disable=unused-import
 
@@ -46,6 +58,96 @@ def elastic_common_argument_spec():
     return options
 
 
+BYTE_SIZE_UNITS = {
+    'b': 1,
+    'k': 1024, 'kb': 1024,
+    'm': 1024 ** 2, 'mb': 1024 ** 2,
+    'g': 1024 ** 3, 'gb': 1024 ** 3,
+    't': 1024 ** 4, 'tb': 1024 ** 4,
+    'p': 1024 ** 5, 'pb': 1024 ** 5,
+}
+
+
+def byte_size_to_bytes(value):
+    """
+    Convert an Elasticsearch byte size such as 40mb or 1.5gb into bytes.
+    Returns None if the value is not a byte size.
+    """
+    match = re.match(r'^(-?\d+(?:\.\d+)?)\s*([a-z]*)$', str(value).strip().lower())
+    if match is None or (match.group(2) and match.group(2) not in BYTE_SIZE_UNITS):
+        return None
+    return int(float(match.group(1)) * BYTE_SIZE_UNITS.get(match.group(2), 1))
+
+
+TIME_UNITS_IN_NANOS = {
+    'nanos': 1,
+    'micros': 1000,
+    'ms': 1000 ** 2,
+    's': 1000 ** 3,
+    'm': 60 * 1000 ** 3,
+    'h': 3600 * 1000 ** 3,
+    'd': 86400 * 1000 ** 3,
+}
+
+
+def time_value_to_nanos(value):
+    """
+    Convert an Elasticsearch time value such as 30s or 1.5h into nanoseconds.
+    -1 and 0 are accepted without a unit. Returns None if the value is not a time value.
+    """
+    value = str(value).strip().lower()
+    if value in ['-1', '0']:
+        return int(value)
+    match = re.match(r'^(\d+(?:\.\d+)?)\s*([a-z]+)$', value)
+    if match is None or match.group(2) not in TIME_UNITS_IN_NANOS:
+        return None
+    return int(float(match.group(1)) * TIME_UNITS_IN_NANOS[match.group(2)])
+
+
+def salted_hash(value, salt=None):
+    """
+    Returns a dict with the salt and a salted PBKDF2 hash of the value, so that
+    a value can later be checked without storing it
+    """
+    if salt is None:
+        salt = os.urandom(16)
+    digest = hashlib.pbkdf2_hmac('sha256', value.encode('utf-8'), salt, 100000)
+    return {
+        "salt": binascii.hexlify(salt).decode('ascii'),
+        "hash": binascii.hexlify(digest).decode('ascii')
+    }
+
+
+def salted_hash_matches(value, entry):
+    """
+    Check a value against an entry returned by salted_hash
+    """
+    return salted_hash(value, binascii.unhexlify(entry['salt']))['hash'] == entry['hash']
+
+
+def load_hash_file(path):
+    """
+    Load a json file of salted hashes, a missing or unreadable file is empty
+    """
+    try:
+        with open(path) as hash_file:
+            return json.load(hash_file)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def save_hash_file(path, hashes):
+    """
+    Write a json file of salted hashes readable only by the owner
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, 0o700)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as hash_file:
+        json.dump(hashes, hash_file)
+
+
 class ElasticHelpers():
     """
     Class containing helper functions for Elasticsearch modules
@@ -99,8 +201,15 @@ class ElasticHelpers():
 
         return auth
 
-    def connect(self):
+    def connect(self, credentials=None):
+        '''
+        Connect using the login options, or as another user when a
+        (username, password) tuple is supplied in credentials
+        '''
         auth = self.build_auth(self.module)
+        if credentials is not None:
+            auth.pop("api_key", None)
+            auth["basic_auth" if __version__ >= (8, 0, 0) else "http_auth"] = credentials
         # python2.7 compatible syntax - double dict expansion not allowed
         options = dict(self.module.params['connection_options'])
         options.update(auth)
@@ -118,17 +227,123 @@ class ElasticHelpers():
         response = client.search(index=index, body=query)
         return response
 
+    def is_index_pattern(self, name):
+        '''
+        Return true if the index name contains a wildcard or is a comma separated list
+        '''
+        return '*' in name or '?' in name or ',' in name or name.startswith('-')
+
+    def batch_index_names(self, names, max_length=MAX_INDEX_NAMES_LENGTH):
+        '''
+        Split the index names into comma joined batches so that
+        each request url stays under the http line length limit.
+        @names - List of index names or patterns.
+        @max_length - Maximum length of each comma joined batch.
+        '''
+        batches = []
+        batch = []
+        length = 0
+        for name in names:
+            if batch and length + len(name) + 1 > max_length:
+                batches.append(",".join(batch))
+                batch = []
+                length = 0
+            batch.append(name)
+            length += len(name) + 1
+        if batch:
+            batches.append(",".join(batch))
+        return batches
+
+    def resolve_indices(self, client, names):
+        '''
+        Resolve index names and wildcard patterns to the list of existing open
+        and closed indexes. Names that do not exist are ignored.
+        Usually a single request regardless of the number of indexes.
+        @client - ES connection
+        @names - List of index names or patterns.
+        '''
+        resolved = set()
+        for batch in self.batch_index_names(names):
+            response = client.indices.get_alias(index=batch,
+                                                ignore_unavailable=True,
+                                                expand_wildcards='open,closed')
+            resolved.update(dict(response).keys())
+        return sorted(resolved)
+
     def index_dynamic_method(self, module, client, method, name):
         '''
         This method is here so we don't have to dulicate loads of code.
         It's only really for very simple methods where we only pass the index name
+        The action is sent directly and a 404 treated as the index not existing,
+        saving an exists request.
         @client - ES connection
         @method - The indicies method to call
         @name - The index name.
         '''
-        if not client.indices.exists(index=name):
-            module.fail_json(msg='Cannot perform {0} action on an index that does not exist'.format(method))
-        else:
-            class_method = getattr(client.indices, method)
+        class_method = getattr(client.indices, method)
+        try:
             response = class_method(index=name)
-            module.exit_json(changed=True, msg="The '{0}' action was performed on the index '{1}'.".format(method, name), **response)
+        except NotFoundError:
+            module.fail_json(msg='Cannot perform {0} action on an index that does not exist'.format(method))
+        module.exit_json(changed=True, msg="The '{0}' action was performed on the index '{1}'.".format(method, name), **response)
+
+    def get_task(self, client, task_id):
+        '''
+        Return the tasks api document for the given task id
+        @client - ES connection
+        @task_id - The task id in the node_id:task_number format.
+        '''
+        return dict(client.tasks.get(task_id=task_id))
+
+    def task_progress(self, task):
+        '''
+        Summarise the status of a task returned by the tasks api.
+        Rates and eta are derived from the running time of the task
+        so no state needs to be kept between polls.
+        @task - A tasks api document as returned by get_task
+        '''
+        info = task.get('task', {})
+        status = info.get('status') or {}
+        total = status.get('total', 0)
+        done = sum([status.get(k, 0) for k in ['created', 'updated', 'deleted', 'noops', 'version_conflicts']])
+        elapsed = info.get('running_time_in_nanos', 0) / 1000000000.0
+        docs_per_sec = 0.0
+        eta_seconds = None
+        if elapsed > 0:
+            docs_per_sec = round(done / elapsed, 2)
+        if task.get('completed', False):
+            eta_seconds = 0
+        elif docs_per_sec > 0 and total > 0:
+            eta_seconds = int((total - done) / docs_per_sec)
+        percent = 0.0
+        if total > 0:
+            percent = round(done * 100.0 / total, 2)
+        return {
+            "total": total,
+            "done": done,
+            "percent": percent,
+            "batches": status.get('batches', 0),
+            "elapsed_seconds": round(elapsed, 2),
+            "docs_per_sec": docs_per_sec,
+            "eta_seconds": eta_seconds,
+            "requests_per_second": status.get('requests_per_second'),
+        }
+
+    def wait_for_task(self, client, task_id, deadline, interval):
+        '''
+        Poll the tasks api until the task has completed or the deadline is reached.
+        Short polls are used rather than a single long-lived request.
+        Returns a tuple of the last task document and whether it completed.
+        @client - ES connection
+        @task_id - The task id to poll.
+        @deadline - Maximum number of seconds to wait.
+        @interval - Number of seconds to sleep between polls.
+        '''
+        started = time.time()
+        while True:
+            task = self.get_task(client, task_id)
+            if task.get('completed', False):
+                return task, True
+            if time.time() - started + interval > deadline:
+                return task, False
+            time.sleep(interval)
@@ -16,6 +16,8 @@ short_description: Create and manage API keys for elastic.
 description:
   - Create and manage API keys for elastic.
   - To protect sensitive value you can use no_log with this module.
+  - Only the keys owned by the authenticated user are looked up and invalidated,
+    even when the user has the manage_api_key privilege.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "1.4.0"
@@ -27,8 +29,64 @@ options:
   name:
     description:
       - The name of the API key.
+      - Mutually exclusive with I(api_keys).
     type: str
-    required: true
+  api_keys:
+    description:
+      - A list of API keys to manage in a single task.
+      - The existing keys of every name are fetched with one paginated query.
+      - Expired keys of the listed names are invalidated, as are superseded keys beyond I(keep_superseded).
+        Invalidation sends one request per I(batch_size) ids.
+      - Mutually exclusive with I(name).
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - The name of the API key.
+        type: str
+        required: true
+      state:
+        description:
+          - The required state of the API key.
+        type: str
+        choices:
+          - present
+          - absent
+        default: present
+      expiration:
+        description:
+          - The expiration time for new API keys e.g. 30d.
+        type: str
+      role_descriptors:
+        description:
+          - The role descriptors of new API keys.
+        type: dict
+        default: {}
+      metadata:
+        description:
+          - Arbitrary metadata associated with new API keys.
+        type: dict
+        default: {}
+  rotate_after:
+    description:
+      - Only used with I(api_keys).
+      - Create a new key when the newest valid key of a name is older than this e.g. C(30d).
+      - The older keys stay valid until they expire, or are invalidated by I(keep_superseded),
+        so there is an overlap during which both keys are valid. Set I(expiration) longer
+        than I(rotate_after) to control the length of the overlap.
+    type: str
+  keep_superseded:
+    description:
+      - Only used with I(api_keys).
+      - The number of valid keys to keep for each name in addition to the newest.
+      - Older valid keys are invalidated. By default superseded keys are kept until they expire.
+    type: int
+  batch_size:
+    description:
+      - The number of keys fetched per page, and invalidated per request, with I(api_keys).
+    type: int
+    default: 1000
   state:
     description:
       - The required state of the API key.
@@ -99,6 +157,20 @@ EXAMPLES = r'''
             privileges:
               - all
   no_log: true
+
+- name: Rotate service keys monthly, keeping the previous key valid for a week of overlap
+  community.elastic.elastic_api_key:
+    rotate_after: 30d
+    keep_superseded: 1
+    api_keys:
+      - name: ingest-service
+        expiration: 37d
+      - name: reporting-service
+        expiration: 37d
+      - name: retired-service
+        state: absent
+  register: keys
+  no_log: true
 '''
 
 RETURN = r'''
@@ -122,6 +194,18 @@ RETURN = r'''
     description: API key credentials which is the base64-encoding of the UTF-8 representation of id and api_key joined by a colon (:).
     returned: on success
     type: str
+  created:
+    description:
+      - The keys created with I(api_keys), each with name, id, api_key, encoded and expiration.
+      - In check mode only the name is returned.
+    returned: when api_keys is supplied
+    type: list
+    elements: dict
+  invalidated:
+    description: The ids of the keys invalidated with I(api_keys).
+    returned: when api_keys is supplied
+    type: list
+    elements: str
 '''
 
 
@@ -141,10 +225,38 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    time_value_to_nanos
 )
 
 
+def query_api_keys(client, query, size=1000):
+    """
+    Run an api key query, following every page with search_after
+    """
+    api_keys = []
+    body = {
+        "query": query,
+        "size": size,
+        "sort": [{"creation": "asc"}, "_doc"]
+    }
+    while True:
+        resp = client.security.query_api_keys(body=body)
+        page = resp.get("api_keys", [])
+        api_keys.extend(page)
+        if len(page) < size:
+            return api_keys
+        body["search_after"] = page[-1]["_sort"]
+
+
+def owned_query(client, query):
+    """
+    Limit a query to the api keys owned by the authenticated user
+    """
+    username = dict(client.security.authenticate())["username"]
+    return {"bool": {"filter": [query, {"term": {"username": username}}]}}
+
+
 def api_key_exists_expired(client, name):
     """
     Checks if an API key with the given name exists and is NOT expired.
@@ -154,17 +266,7 @@ def api_key_exists_expired(client, name):
         False -> no key exists OR all keys are expired/invalidated
     """
 
-    resp = client.security.query_api_keys(
-        body={
-            "query": {
-                "term": {
-                    "name": name
-                }
-            }
-        }
-    )
-
-    api_keys = resp.get("api_keys", [])
+    api_keys = query_api_keys(client, owned_query(client, {"term": {"name": name}}))
 
     if not api_keys:
         return False
@@ -180,14 +282,16 @@ def api_key_exists_expired(client, name):
     return False
 
 
-def create_api_key(module, client):
+def create_api_key(module, client, params=None):
     """
     Creates an Elastic API key (compatible with ES 7 and 8+)
     """
-    name = module.params['name']
-    role_descriptors = module.params.get('role_descriptors')
-    metadata = module.params.get('metadata')
-    expiration = module.params.get('expiration')
+    if params is None:
+        params = module.params
+    name = params['name']
+    role_descriptors = params.get('role_descriptors')
+    metadata = params.get('metadata')
+    expiration = params.get('expiration')
 
     version = elasticsearch.VERSION
     major = version[0]
@@ -216,7 +320,7 @@ def create_api_key(module, client):
 
 def delete_api_key(client, name):
     """
-    Invalidates an API key by name (ES 7 and 8+ compatible)
+    Invalidates the API keys of the authenticated user with the given name (ES 7 and 8+ compatible)
     """
     version = elasticsearch.VERSION
     major = version[0]
@@ -225,18 +329,85 @@ def delete_api_key(client, name):
         # ES 7.x: must use body
         resp = client.security.invalidate_api_key(
             body={
-                "name": name
+                "name": name,
+                "owner": True
             }
         )
     else:
         # ES 8+: keyword arguments
         resp = client.security.invalidate_api_key(
-            name=name
+            name=name,
+            owner=True
         )
 
     return resp
 
 
+def invalidate_api_keys(client, ids, batch_size):
+    """
+    Invalidates API keys by id, one request per batch of ids
+    """
+    major = elasticsearch.VERSION[0]
+    for i in range(0, len(ids), batch_size):
+        batch = ids[i:i + batch_size]
+        if major <= 7:
+            client.security.invalidate_api_key(body={"ids": batch})
+        else:
+            client.security.invalidate_api_key(ids=batch)
+
+
+def plan_api_key(module, params, keys, now):
+    """
+    Decide whether a new key is needed for a name, and which of its
+    existing keys are invalidated. Returns (create, invalidate_ids).
+    """
+    expired = [k for k in keys if k.get("expiration") is not None and k["expiration"] <= now]
+    valid = [k for k in keys if k not in expired]
+    valid.sort(key=lambda k: k.get("creation", 0), reverse=True)
+    invalidate = [k["id"] for k in expired]
+    if params['state'] == "absent":
+        return False, invalidate + [k["id"] for k in valid]
+    create = len(valid) == 0
+    rotate_after = module.params['rotate_after']
+    if valid and rotate_after is not None:
+        create = valid[0].get("creation", 0) <= now - time_value_to_nanos(rotate_after) // 1000000
+    superseded = valid if create else valid[1:]
+    keep_superseded = module.params['keep_superseded']
+    if keep_superseded is not None:
+        invalidate += [k["id"] for k in superseded[keep_superseded:]]
+    return create, invalidate
+
+
+def manage_api_keys(module, client):
+    """
+    Fetch the keys of every name with one paginated query, then create
+    and invalidate keys as needed
+    """
+    names = [params['name'] for params in module.params['api_keys']]
+    query = owned_query(client, {"bool": {"filter": [{"terms": {"name": names}}, {"term": {"invalidated": False}}]}})
+    existing = {}
+    for key in query_api_keys(client, query, module.params['batch_size']):
+        existing.setdefault(key["name"], []).append(key)
+    now = int(time.time() * 1000)
+    created = []
+    invalidated = []
+    for params in module.params['api_keys']:
+        create, invalidate = plan_api_key(module, params, existing.get(params['name'], []), now)
+        invalidated += invalidate
+        if create:
+            if module.check_mode:
+                created.append({"name": params['name']})
+            else:
+                resp = dict(create_api_key(module, client, params))
+                created.append(dict((k, resp.get(k)) for k in ["name", "id", "api_key", "encoded", "expiration"]))
+    if invalidated and not module.check_mode:
+        invalidate_api_keys(client, invalidated, module.params['batch_size'])
+    module.exit_json(changed=len(created + invalidated) > 0,
+                     msg="{0} api key(s) created and {1} invalidated.".format(len(created), len(invalidated)),
+                     created=created,
+                     invalidated=invalidated)
+
+
 # ================
 # Module execution
 #
@@ -250,17 +421,29 @@ def main():
 
     argument_spec = elastic_common_argument_spec()
     argument_spec.update(
-        name=dict(type='str', required=True),
+        name=dict(type='str'),
         state=dict(type='str', choices=state_choices, default='present'),
         expiration=dict(type='str', default=None),
         role_descriptors=dict(type='dict', default={}),
         metadata=dict(type='dict', default={}),
+        api_keys=dict(type='list', elements='dict', no_log=False, options=dict(
+            name=dict(type='str', required=True),
+            state=dict(type='str', choices=state_choices, default='present'),
+            expiration=dict(type='str'),
+            role_descriptors=dict(type='dict', default={}),
+            metadata=dict(type='dict', default={}),
+        )),
+        rotate_after=dict(type='str'),
+        keep_superseded=dict(type='int'),
+        batch_size=dict(type='int', default=1000),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
         required_together=[['login_user', 'login_password']],
+        required_one_of=[['name', 'api_keys']],
+        mutually_exclusive=[['name', 'api_keys']],
     )
 
     if not elastic_found:
@@ -270,10 +453,18 @@ def main():
     name = module.params['name']
     state = module.params['state']
 
+    if module.params['rotate_after'] is not None and time_value_to_nanos(module.params['rotate_after']) is None:
+        module.fail_json(msg="Invalid rotate_after time value: {0}".format(module.params['rotate_after']))
+    if module.params['batch_size'] < 1:
+        module.fail_json(msg="batch_size must be at least 1.")
+
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
+        if module.params['api_keys'] is not None:
+            manage_api_keys(module, client)
+
         api_key = api_key_exists_expired(client, name)
 
         if api_key is False:
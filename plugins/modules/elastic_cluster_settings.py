@@ -15,6 +15,8 @@ short_description: Manage Elastic Search Cluster Settings
 
 description:
   - Manage Elastic Search Cluster Settings
+  - Only the persistent and transient settings are fetched. Defaults are fetched only for the supplied settings that are not set.
+  - Byte sizes and time values are compared after converting units, so C(1gb) and C(1024mb) are equal.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -35,6 +37,13 @@ options:
       - Supply as a dict key/values.
     type: dict
     required: True
+  revert_after:
+    description:
+      - Revert the changed settings to their previous values after this time e.g. C(30m) or C(2h).
+      - The module applies the settings, waits and then reverts them, so should be run with async for long periods.
+      - A setting that was changed again by something else while waiting is not reverted.
+      - The previous values are also returned in I(previous_settings) so they can be restored by a later task instead.
+    type: str
 '''
 
 EXAMPLES = r'''
@@ -50,9 +59,49 @@ EXAMPLES = r'''
       action.destructive_requires_name: null
       cluster.auto_shrink_voting_configuration: null
       cluster.indices.close.enable: null
+
+- name: Speed up recoveries for two hours during a rolling restart
+  community.elastic.elastic_cluster_settings:
+    settings:
+      indices.recovery.max_bytes_per_sec: "500mb"
+      cluster.routing.allocation.node_concurrent_recoveries: 8
+    revert_after: 2h
+  async: 7500
+  poll: 0
+
+- name: Disable shard allocation for the maintenance and restore it afterwards
+  block:
+    - name: Disable shard allocation
+      community.elastic.elastic_cluster_settings:
+        settings:
+          cluster.routing.allocation.enable: "primaries"
+      register: allocation
+
+    - name: Do the maintenance
+      ansible.builtin.debug:
+        msg: "Restarting nodes"
+  always:
+    - name: Restore the previous value of the setting
+      community.elastic.elastic_cluster_settings:
+        settings: "{{ allocation.previous_settings }}"
+      when: allocation.previous_settings is defined
 '''
 
 RETURN = r'''
+cluster_cfg_changes:
+  description: The settings changed, each with the old_value and new_value.
+  returned: when settings were changed
+  type: dict
+previous_settings:
+  description:
+    - The values of the changed settings before the change, null for settings that were not set.
+    - Can be supplied as I(settings) to restore the previous configuration.
+  returned: when settings were changed
+  type: dict
+reverted:
+  description: The settings reverted to their previous values when I(revert_after) is used.
+  returned: when revert_after is supplied and settings were changed
+  type: dict
 '''
 
 
@@ -60,12 +109,16 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
 
+import time
+
 from ansible_collections.community.elastic.plugins.module_utils.elastic_common import (
     missing_required_lib,
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    byte_size_to_bytes,
+    time_value_to_nanos
 )
 
 
@@ -75,9 +128,101 @@ def cluster_put_settings(client, body):
 
 
 def cluster_get_settings(client):
+    '''
+    Get the persistent and transient settings only, the defaults are large
+    '''
+    response = client.cluster.get_settings(flat_settings=True)
+    if hasattr(response, 'body'):  # Required for Elasticsearch 8.x
+        response = response.body
+    return dict(response)
+
+
+def flatten_settings(settings, prefix=''):
+    '''
+    Flatten a nested settings document into dotted keys
+    '''
+    flat = {}
+    for key, value in settings.items():
+        if isinstance(value, dict):
+            flat.update(flatten_settings(value, prefix + key + '.'))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def cluster_get_defaults(client, keys):
+    '''
+    Get the default values of the given settings using filter_path.
+    filter_path matches the nested path of each key, so the defaults are
+    requested nested and flattened here.
+    '''
+    if not keys:
+        return {}
+    filter_path = ",".join(["defaults.{0}".format(key) for key in keys])
     response = client.cluster.get_settings(include_defaults=True,
-                                           flat_settings=True)
-    return response
+                                           filter_path=filter_path)
+    if hasattr(response, 'body'):  # Required for Elasticsearch 8.x
+        response = response.body
+    return flatten_settings(dict(response).get('defaults', {}))
+
+
+def setting_to_str(value):
+    '''
+    Elastic returns settings as strings
+    '''
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, list):
+        return [setting_to_str(v) for v in value]
+    return str(value).strip()
+
+
+def setting_in_base_units(value):
+    '''
+    Convert a time value or byte size with a unit into a (kind, amount) pair.
+    Time units are tried first so a bare m is read as minutes. Values without
+    a unit are not converted as their kind is unknown.
+    '''
+    if not value[-1:].isalpha():
+        return None
+    nanos = time_value_to_nanos(value)
+    if nanos is not None:
+        return ('time', nanos)
+    size = byte_size_to_bytes(value)
+    if size is not None:
+        return ('bytes', size)
+    return None
+
+
+def setting_is_equal(value1, value2):
+    '''
+    Compare two setting values. Byte sizes and time values are compared
+    after converting units so 1gb equals 1024mb and 30s equals 30000ms.
+    '''
+    if value1 is None or value2 is None:
+        return value1 is None and value2 is None
+    value1 = setting_to_str(value1)
+    value2 = setting_to_str(value2)
+    if value1 == value2:
+        return True
+    if isinstance(value1, list) or isinstance(value2, list):
+        return False
+    converted = setting_in_base_units(value1)
+    return converted is not None and converted == setting_in_base_units(value2)
+
+
+def revert_settings(module, client, selected_key, settings, previous_settings):
+    '''
+    Revert the settings that still have the value we set to their previous value
+    '''
+    current_settings = cluster_get_settings(client).get(selected_key, {})
+    revert_doc = {}
+    for key, previous_value in previous_settings.items():
+        if setting_is_equal(current_settings.get(key), settings[key]):
+            revert_doc[key] = previous_value
+    if revert_doc and not module.check_mode:
+        cluster_put_settings(client, body={selected_key: revert_doc})
+    return revert_doc
 
 
 # ================
@@ -89,6 +234,7 @@ def main():
     argument_spec.update(
         persistent=dict(type='bool', default=True),
         settings=dict(type='dict', required=True),
+        revert_after=dict(type='str'),
     )
 
     module = AnsibleModule(
@@ -103,8 +249,13 @@ def main():
 
     persistent = module.params['persistent']
     settings = module.params['settings']
+    revert_after = module.params['revert_after']
+
+    if revert_after is not None:
+        revert_after_nanos = time_value_to_nanos(revert_after)
+        if revert_after_nanos is None or revert_after_nanos < 0:
+            module.fail_json(msg="Invalid revert_after time value: {0}".format(revert_after))
 
-    # TODO main module logic
     try:
         if persistent:
             settings_doc = {"persistent": settings}
@@ -115,46 +266,41 @@ def main():
         client = elastic.connect()
 
         current_settings = cluster_get_settings(client)
-        if hasattr(current_settings, 'body'):  # Required for Elasticsearch 8.x
-            current_settings = current_settings.body
-
-        if persistent:
-            del current_settings['transient']
-        else:
-            del current_settings['persistent']
 
         # Fail if we have any unexpected keys
-        if len(list(set(current_settings.keys()) - set(['persistent', 'transient', 'defaults']))) > 0:
-            unexpected_keys = list(set(current_settings.keys()) - set(['persistent', 'transient', 'defaults']))
+        if len(list(set(current_settings.keys()) - set(['persistent', 'transient']))) > 0:
+            unexpected_keys = list(set(current_settings.keys()) - set(['persistent', 'transient']))
             module.fail_json(msg="Unexpected key found in cluster config: {0}".format(str(unexpected_keys)))
 
         cluster_configuration_changes = {}
         selected_key = list(settings_doc.keys())[0]
+        current_settings = current_settings.get(selected_key, {})
         none_debug = False
+        missing_keys = []
         for config_item in list(settings_doc[selected_key].keys()):
-            desired_value = None
-            actual_value = None
-            if settings_doc[selected_key][config_item] is None \
-                    and config_item in list(current_settings[selected_key].keys()):
+            if settings_doc[selected_key][config_item] is None:
+                if config_item in current_settings:
+                    cluster_configuration_changes[config_item] = {
+                        "old_value": None,
+                        "new_value": "<default>"
+                    }
+            elif config_item not in current_settings:
+                missing_keys.append(config_item)
+            elif not setting_is_equal(settings_doc[selected_key][config_item],
+                                      current_settings[config_item]):
                 cluster_configuration_changes[config_item] = {
-                    "old_value": None,
-                    "new_value": "<default>"
+                    "old_value": current_settings[config_item],
+                    "new_value": settings_doc[selected_key][config_item]
                 }
-            elif settings_doc[selected_key][config_item] == \
-                    current_settings[selected_key].get(config_item):
-                pass
-            elif settings_doc[selected_key][config_item] == \
-                    current_settings["defaults"].get(config_item):
-                pass
-            else:
-                # If we reach here the value results in a cluster settings change
-                desired_value = settings_doc[selected_key][config_item]
-                actual_value = current_settings[selected_key].get(config_item)
-                if actual_value is None:
-                    actual_value = current_settings["defaults"].get(config_item)
+
+        # Only settings that are not set need to be compared with their default
+        default_settings = cluster_get_defaults(client, missing_keys)
+        for config_item in missing_keys:
+            if not setting_is_equal(settings_doc[selected_key][config_item],
+                                    default_settings.get(config_item)):
                 cluster_configuration_changes[config_item] = {
-                    "old_value": actual_value,
-                    "new_value": desired_value
+                    "old_value": default_settings.get(config_item),
+                    "new_value": settings_doc[selected_key][config_item]
                 }
 
         if none_debug:
@@ -163,16 +309,28 @@ def main():
         if cluster_configuration_changes == {}:
             module.exit_json(changed=False, msg="There are no cluster configuration changes to perform.")
         else:
+            previous_settings = dict((key, current_settings.get(key)) for key in cluster_configuration_changes)
+            result = dict(changed=True,
+                          msg="The cluster configuration has been updated.",
+                          cluster_cfg_changes=cluster_configuration_changes,
+                          previous_settings=previous_settings)
             if module.check_mode:
-                module.exit_json(changed=True,
-                                 msg="The cluster configuration has been updated.",
-                                 cluster_cfg_changes=cluster_configuration_changes)
+                if revert_after is not None:
+                    result['reverted'] = previous_settings
+                module.exit_json(**result)
             else:
                 response = cluster_put_settings(client, body=settings_doc)
                 if response['acknowledged']:
-                    module.exit_json(changed=True,
-                                     msg="The cluster configuration has been updated.",
-                                     cluster_cfg_changes=cluster_configuration_changes)
+                    if revert_after is not None:
+                        time.sleep(revert_after_nanos / 1000.0 ** 3)
+                        try:
+                            result['reverted'] = revert_settings(module, client, selected_key,
+                                                                 settings, previous_settings)
+                        except Exception as excep:
+                            result['msg'] = "The cluster configuration was updated but reverting it failed: {0}".format(to_native(excep))
+                            module.fail_json(**result)
+                        result['msg'] = "The cluster configuration was updated and reverted after {0}.".format(revert_after)
+                    module.exit_json(**result)
                 else:
                     module.fail_json(msg="Something has gone wrong: {0}".format(str(response)))
     except Exception as excep:
@@ -18,8 +18,14 @@ description:
   - Create indexes and drop indexes.
   - Perform some index maintenance operations.
   - Create indexes with settings and mapping documents.
-  - No support for settings or mapping document updates.
-  - check_mode only relevant to present and absent states.
+  - Settings and mappings of existing indexes are compared with those supplied.
+    Only dynamic settings and new mapping fields that differ are sent.
+  - Differences in static settings or existing mapping fields cannot be applied to an open index
+    and are reported as warnings.
+  - check_mode only relevant to present, absent, forcemerge, shrink, split and clone states.
+  - Multiple indexes can be managed at once by supplying a list of names or wildcard patterns.
+  - The forcemerge, shrink, split and clone states run in the background and are polled until they complete.
+    I(max_concurrent) limits how many indexes are processed at the same time.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -42,22 +48,73 @@ options:
       - refresh
       - stats
       - upgrade
+      - forcemerge
+      - shrink
+      - split
+      - clone
     default: present
   name:
     description:
-      - The index name
-    type: str
+      - The index name.
+      - A list of index names and wildcard patterns can be supplied to act on many indexes at once.
+        The matching indexes are resolved in a single request and the action is sent in comma
+        separated batches.
+      - Wildcard patterns match open and closed indexes but cannot be used with I(state=present).
+      - With I(state=present) missing indexes in the list are created and the settings and mappings of
+        existing ones are reconciled as for a single index.
+    type: list
+    elements: str
     required: True
   settings:
     description:
       - Index settings document.
+      - Nested and dotted forms are equivalent and the index. prefix is optional.
+      - Set a setting to null to reset it to its default.
     type: dict
     default: {}
   mappings:
     description:
       - Index mappings document.
+      - Fields may be supplied in nested or dotted form.
     type: dict
     default: {}
+  max_num_segments:
+    description:
+      - Only used with I(state=forcemerge).
+      - The number of segments each shard is merged down to.
+      - Indexes where every primary shard already has this many segments or fewer are skipped.
+    type: int
+  target:
+    description:
+      - Required with I(state=shrink), I(state=split) and I(state=clone).
+      - The name of the index to create.
+      - When acting on many indexes this must contain C({index}) which is replaced by the source index name.
+      - Existing targets are skipped.
+      - I(settings) are applied to the target index, e.g. index.number_of_shards.
+      - The source index is made read-only before the operation, as required by Elasticsearch.
+        For I(state=shrink) a copy of every shard must also be allocated to a single node beforehand.
+      - The write block is removed from the source again once the target is active, unless the source was
+        already read-only. Sources of operations still running when I(deadline) is reached remain read-only.
+    type: str
+  max_concurrent:
+    description:
+      - Only used with I(state=forcemerge), I(state=shrink), I(state=split) and I(state=clone).
+      - The maximum number of indexes processed at the same time.
+    type: int
+    default: 1
+  deadline:
+    description:
+      - Only used with I(state=forcemerge), I(state=shrink), I(state=split) and I(state=clone).
+      - Maximum number of seconds to wait for the operations to complete. 0 means no deadline.
+      - Operations already started keep running in the background when the deadline is reached,
+        and indexes not yet started are reported as pending.
+    type: int
+    default: 0
+  interval:
+    description:
+      - The number of seconds to sleep between polls of running operations.
+    type: int
+    default: 10
   wait_for_active_shards:
     description:
       - A number controlling to how many active shards to wait for.
@@ -92,9 +149,88 @@ EXAMPLES = r'''
         age: { "type": "integer" }
         email: { "type": "keyword" }
         name: { "type": "text" }
+
+- name: Close all of last year's daily indexes
+  community.elastic.elastic_index:
+    name: "logs-2025.*"
+    state: closed
+
+- name: Refresh a list of indexes
+  community.elastic.elastic_index:
+    name:
+      - myindex1
+      - myindex2
+      - "myotherindex-*"
+    state: refresh
+
+- name: Ensure myindex has one replica and a new keyword field, updating the index only if needed
+  community.elastic.elastic_index:
+    name: myindex
+    settings:
+      index.number_of_replicas: 1
+      refresh_interval: 30s
+    mappings:
+      properties:
+        user.id: { "type": "keyword" }
+
+- name: Force merge last month's read-only indexes to one segment, two at a time
+  community.elastic.elastic_index:
+    name: "logs-2026.09.*"
+    state: forcemerge
+    max_num_segments: 1
+    max_concurrent: 2
+
+- name: Shrink an index to a single shard
+  community.elastic.elastic_index:
+    name: myindex
+    state: shrink
+    target: myindex-shrunk
+    settings:
+      index.number_of_shards: 1
+      index.number_of_replicas: 1
+    deadline: 3600
 '''
 
 RETURN = r'''
+settings_changes:
+  description: The dynamic settings that were changed on an existing index, each with old_value and new_value.
+  returned: when state is present and the index already exists
+  type: dict
+static_settings_changes:
+  description: Static settings that differ but cannot be changed on an open index, each with old_value and new_value.
+  returned: when state is present and the index already exists
+  type: dict
+mapping_changes:
+  description:
+    - Differences between the supplied and current mappings of an existing index.
+    - Contains added (new fields), updated (top level mapping parameters) and conflicts
+      (existing fields that differ and were not sent).
+  returned: when state is present and the index already exists
+  type: dict
+results:
+  description:
+    - The outcome for each index with I(state=forcemerge), I(state=shrink), I(state=split) and I(state=clone).
+    - Each item contains index, status and, where relevant, task and target.
+    - status is one of completed, skipped, failed, running or pending.
+    - For shrink, split and clone write_block is true while the write block added by the module remains on the source.
+  returned: when state is forcemerge, shrink, split or clone
+  type: list
+  elements: dict
+index_changes:
+  description:
+    - The differences found for each existing index, keyed by index name.
+    - Each contains settings_changes, static_settings_changes and mapping_changes as for a single index.
+  returned: when a list of names is supplied and state is present
+  type: dict
+indices:
+  description: The indexes acted upon, with I(state=present) those created or updated.
+  returned: when a list of names or a wildcard pattern is supplied
+  type: list
+  elements: str
+stats:
+  description: Index stats keyed by index name.
+  returned: when a list of names or a wildcard pattern is supplied and state is stats
+  type: dict
 '''
 
 
@@ -107,8 +243,440 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    NotFoundError,
+    __version__
 )
+import json
+import time
+
+
+STATIC_INDEX_SETTINGS = [
+    "index.codec",
+    "index.load_fixed_bitset_filters_eagerly",
+    "index.mode",
+    "index.number_of_routing_shards",
+    "index.number_of_shards",
+    "index.routing_partition_size",
+    "index.shard.check_on_startup",
+    "index.soft_deletes.enabled",
+    "index.store.type",
+]
+
+STATIC_INDEX_SETTING_PREFIXES = [
+    "index.analysis.",
+    "index.similarity.",
+    "index.sort.",
+]
+
+UPDATABLE_MAPPING_PARAMETERS = [
+    "_meta",
+    "date_detection",
+    "dynamic",
+    "dynamic_date_formats",
+    "dynamic_templates",
+    "numeric_detection",
+]
+
+
+def get_index(client, name):
+    '''
+    Get the settings and mappings of an index in a single request
+    '''
+    try:
+        response = dict(client.indices.get(index=name, flat_settings=True))
+    except NotFoundError:
+        return None
+    return list(response.values())[0]
+
+
+def flatten_settings(settings, prefix=''):
+    '''
+    Flatten a nested settings document into dotted keys
+    '''
+    flat = {}
+    for key, value in settings.items():
+        if isinstance(value, dict):
+            flat.update(flatten_settings(value, prefix + key + '.'))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def normalise_value(value):
+    '''
+    Elastic returns scalar settings and mapping parameters as strings
+    '''
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, list):
+        return [normalise_value(v) for v in value]
+    if isinstance(value, dict):
+        return dict((k, normalise_value(v)) for k, v in value.items())
+    return str(value)
+
+
+def settings_changes(client, name, current, desired_settings):
+    '''
+    Compare the desired settings with the explicit settings of the index.
+    Defaults are only fetched for desired keys that are not explicitly set.
+    Returns the dynamic and static settings that differ.
+    '''
+    desired = {}
+    for key, value in flatten_settings(desired_settings).items():
+        if not key.startswith('index.'):
+            key = 'index.' + key
+        desired[key] = normalise_value(value)
+
+    defaults = {}
+    missing = [k for k, v in desired.items() if k not in current and v is not None]
+    if missing:
+        response = dict(client.indices.get_settings(index=name,
+                                                    name=",".join(missing),
+                                                    include_defaults=True,
+                                                    flat_settings=True))
+        for index_settings in response.values():
+            defaults.update(index_settings.get('defaults', {}))
+
+    dynamic_changes = {}
+    static_changes = {}
+    for key, value in desired.items():
+        if key in current:
+            old_value = normalise_value(current[key])
+        elif value is None:
+            continue
+        else:
+            old_value = normalise_value(defaults.get(key))
+        if old_value == value:
+            continue
+        change = {"old_value": old_value, "new_value": value}
+        if key in STATIC_INDEX_SETTINGS or [p for p in STATIC_INDEX_SETTING_PREFIXES if key.startswith(p)]:
+            static_changes[key] = change
+        else:
+            dynamic_changes[key] = change
+    return dynamic_changes, static_changes
+
+
+def normalise_mapping(definition):
+    '''
+    Expand dotted field names into nested properties and drop
+    the implicit object type so mappings compare like Elastic returns them
+    '''
+    definition = dict(definition)
+    if 'properties' in definition:
+        properties = {}
+        for field, field_definition in definition['properties'].items():
+            parts = field.split('.')
+            target = properties
+            for part in parts[:-1]:
+                target = target.setdefault(part, {}).setdefault('properties', {})
+            field_definition = normalise_mapping(field_definition)
+            if parts[-1] in target and 'properties' in field_definition:
+                target[parts[-1]].setdefault('properties', {}).update(field_definition.pop('properties'))
+                target[parts[-1]].update(field_definition)
+            else:
+                target[parts[-1]] = field_definition
+        definition['properties'] = properties
+        if definition.get('type') == 'object':
+            definition.pop('type')
+    return definition
+
+
+def mapping_is_different(value1, value2):
+    return json.dumps(normalise_value(value1), sort_keys=True) != json.dumps(normalise_value(value2), sort_keys=True)
+
+
+def mapping_changes(current, desired, path=''):
+    '''
+    Compare desired mapping properties with the current mapping.
+    Returns the additive update to send along with the added and conflicting field paths.
+    '''
+    update = {}
+    added = []
+    conflicts = []
+    current_properties = current.get('properties', {})
+    for field, definition in desired.get('properties', {}).items():
+        field_path = path + field
+        if field not in current_properties:
+            update[field] = definition
+            added.append(field_path)
+            continue
+        current_definition = current_properties[field]
+        for key, value in definition.items():
+            if key != 'properties' and mapping_is_different(value, current_definition.get(key)):
+                conflicts.append(field_path)
+                break
+        if 'properties' in definition:
+            sub_update, sub_added, sub_conflicts = mapping_changes(current_definition, definition, field_path + '.')
+            if sub_update:
+                update[field] = {"properties": sub_update}
+                if current_definition.get('type') == 'nested':
+                    update[field]['type'] = 'nested'
+            added.extend(sub_added)
+            conflicts.extend(sub_conflicts)
+    return update, added, conflicts
+
+
+def index_reconciliation(module, client, name, current):
+    '''
+    Send only the dynamic settings and additive mapping changes that differ.
+    Returns whether the index was changed and the differences found.
+    '''
+    changes, static_changes = settings_changes(client, name, current.get('settings', {}), module.params['settings'])
+
+    desired_mappings = normalise_mapping(module.params['mappings'])
+    current_mappings = current.get('mappings', {})
+    mapping_update, added, conflicts = mapping_changes(current_mappings, desired_mappings)
+    mapping_body = {}
+    if mapping_update:
+        mapping_body['properties'] = mapping_update
+    updated = []
+    for key, value in desired_mappings.items():
+        if key != 'properties' and mapping_is_different(value, current_mappings.get(key)):
+            if key in UPDATABLE_MAPPING_PARAMETERS:
+                mapping_body[key] = value
+                updated.append(key)
+            else:
+                conflicts.append(key)
+
+    if static_changes:
+        module.warn("Static settings cannot be changed on the open index {0}: {1}".format(name, ", ".join(sorted(static_changes.keys()))))
+    if conflicts:
+        module.warn("Existing mapping fields of the index {0} cannot be changed: {1}".format(name, ", ".join(conflicts)))
+
+    if not module.check_mode:
+        if changes:
+            body = dict((key, change['new_value']) for key, change in changes.items())
+            client.indices.put_settings(index=name, body=body)
+        if mapping_body:
+            client.indices.put_mapping(index=name, body=mapping_body)
+
+    result = dict(settings_changes=changes,
+                  static_settings_changes=static_changes,
+                  mapping_changes=dict(added=added, updated=updated, conflicts=conflicts))
+    return bool(changes or mapping_body), result
+
+
+def reconcile_index(module, client, name, current):
+    '''
+    Reconcile a single existing index with the supplied settings and mappings
+    '''
+    changed, result = index_reconciliation(module, client, name, current)
+    if changed:
+        module.exit_json(changed=True, msg="The index '{0}' was updated.".format(name), **result)
+    module.exit_json(changed=False, msg="The index '{0}' already exists.".format(name), **result)
+
+
+def is_merged(client, index, max_num_segments):
+    '''
+    Return true if every primary shard of the index has at most max_num_segments segments
+    '''
+    response = dict(client.indices.stats(index=index, metric='segments', level='shards'))
+    shards = response['indices'].get(index, {}).get('shards', {})
+    for copies in shards.values():
+        for copy in copies:
+            if copy['routing']['primary'] and copy['segments']['count'] > max_num_segments:
+                return False
+    return True
+
+
+def is_write_blocked(client, index):
+    '''
+    Return true if the index already has a write block
+    '''
+    response = dict(client.indices.get_settings(index=index, name='index.blocks.write'))
+    blocks = response.get(index, {}).get('settings', {}).get('index', {}).get('blocks', {})
+    return str(blocks.get('write', 'false')).lower() == 'true'
+
+
+def remove_write_block(client, entry):
+    '''
+    Remove the write block the module added to the source of a shrink, split or clone
+    '''
+    if entry.get('write_block'):
+        client.indices.put_settings(index=entry['index'], body={"index.blocks.write": None})
+        entry['write_block'] = False
+
+
+def start_index_operation(module, client, index, state):
+    '''
+    Start a forcemerge, shrink, split or clone operation.
+    Returns the entry describing the operation.
+    '''
+    entry = {"index": index}
+    if state == 'forcemerge':
+        max_num_segments = module.params['max_num_segments']
+        if max_num_segments is not None and is_merged(client, index, max_num_segments):
+            entry['status'] = "skipped"
+            return entry
+        if module.check_mode:
+            entry['status'] = "completed"
+            return entry
+        forcemerge_arg = {"index": index}
+        if max_num_segments is not None:
+            forcemerge_arg['max_num_segments'] = max_num_segments
+        if __version__ >= (8, 0, 0):
+            response = dict(client.indices.forcemerge(wait_for_completion=False, **forcemerge_arg))
+        else:  # The 7.x client only accepts wait_for_completion as a query parameter
+            response = dict(client.indices.forcemerge(params={"wait_for_completion": "false"}, **forcemerge_arg))
+        entry['task'] = response['task']
+        entry['status'] = "running"
+    else:
+        target = module.params['target'].replace('{index}', index)
+        entry['target'] = target
+        if client.indices.exists(index=target):
+            entry['status'] = "skipped"
+            return entry
+        if module.check_mode:
+            entry['status'] = "completed"
+            return entry
+        if not is_write_blocked(client, index):
+            client.indices.put_settings(index=index, body={"index.blocks.write": True})
+            entry['write_block'] = True
+        settings = {"index.blocks.write": None}
+        if state == 'shrink':
+            settings['index.routing.allocation.require._name'] = None
+        settings.update(module.params['settings'])
+        try:
+            getattr(client.indices, state)(index=index, target=target, body={"settings": settings})
+        except Exception:
+            remove_write_block(client, entry)
+            raise
+        entry['status'] = "running"
+    return entry
+
+
+def poll_index_operation(elastic, client, entry):
+    '''
+    Update the entry of a running operation. Merges are followed via the tasks api,
+    shrink, split and clone are complete once the primaries of the target are active.
+    '''
+    if 'task' in entry:
+        task = elastic.get_task(client, entry['task'])
+        if task.get('completed', False):
+            if 'error' in task:
+                entry['status'] = "failed"
+                entry['error'] = task['error']
+            else:
+                entry['status'] = "completed"
+    else:
+        health = dict(client.cluster.health(index=entry['target']))
+        entry['active_primary_shards'] = health['active_primary_shards']
+        entry['initializing_shards'] = health['initializing_shards']
+        if health['status'] in ['yellow', 'green']:
+            entry['status'] = "completed"
+            remove_write_block(client, entry)
+
+
+def run_index_operations(module, elastic, client, names, state):
+    '''
+    Run forcemerge, shrink, split or clone on the matching indexes,
+    at most max_concurrent at a time, until all complete or the deadline is reached.
+    '''
+    indices = elastic.resolve_indices(client, names)
+    missing = [name for name in names if not elastic.is_index_pattern(name) and name not in indices]
+    if missing:
+        module.fail_json(msg="Cannot perform {0} action on indexes that do not exist: {1}".format(state, ", ".join(missing)))
+    if state != 'forcemerge' and len(indices) > 1 and '{index}' not in module.params['target']:
+        module.fail_json(msg="target must contain {index} when performing the " + state + " action on many indexes.")
+
+    max_concurrent = module.params['max_concurrent']
+    deadline = module.params['deadline']
+    interval = module.params['interval']
+    pending = list(indices)
+    running = []
+    results = []
+    started = time.time()
+    while pending or running:
+        while pending and len(running) < max_concurrent:
+            index = pending.pop(0)
+            try:
+                entry = start_index_operation(module, client, index, state)
+            except Exception as excep:
+                entry = {"index": index, "status": "failed", "error": to_native(excep)}
+            results.append(entry)
+            if entry['status'] == "running":
+                running.append(entry)
+        if not running:
+            continue
+        if deadline > 0 and time.time() - started + interval > deadline:
+            break
+        time.sleep(interval)
+        for entry in list(running):
+            poll_index_operation(elastic, client, entry)
+            if entry['status'] != "running":
+                running.remove(entry)
+    for index in pending:
+        results.append({"index": index, "status": "pending"})
+
+    counts = dict((status, len([r for r in results if r['status'] == status]))
+                  for status in ["completed", "skipped", "failed", "running", "pending"])
+    msg = "The '{0}' action completed on {1} of {2} indexes, {3} skipped, {4} failed, {5} running and {6} pending.".format(
+        state, counts['completed'], len(results), counts['skipped'], counts['failed'], counts['running'], counts['pending'])
+    changed = len(results) > counts['skipped'] + counts['failed'] + counts['pending']
+    if counts['failed'] > 0:
+        module.fail_json(changed=changed, msg=msg, results=results)
+    module.exit_json(changed=changed, msg=msg, results=results)
+
+
+def manage_indices(module, elastic, client, names, state, request_body):
+    '''
+    Perform the state action on many indexes at once. The indexes are
+    resolved with a single request and the action sent in comma separated batches.
+    '''
+    existing = elastic.resolve_indices(client, names)
+    missing = [name for name in names if not elastic.is_index_pattern(name) and name not in existing]
+
+    if state == 'present':
+        patterns = [name for name in names if elastic.is_index_pattern(name)]
+        if patterns:
+            module.fail_json(msg="Cannot create indexes from wildcard patterns: {0}".format(", ".join(patterns)))
+        updated = []
+        index_changes = {}
+        for batch in elastic.batch_index_names(existing):
+            for name, current in dict(client.indices.get(index=batch, flat_settings=True)).items():
+                changed, index_changes[name] = index_reconciliation(module, client, name, current)
+                if changed:
+                    updated.append(name)
+        updated = sorted(updated)
+        if not module.check_mode:
+            for name in missing:
+                client.indices.create(index=name, body=request_body)
+        if not missing and not updated:
+            msg = "The indexes {0} already exist.".format(", ".join(names))
+        elif not updated:
+            msg = "The indexes {0} were created.".format(", ".join(missing))
+        elif not missing:
+            msg = "The indexes {0} were updated.".format(", ".join(updated))
+        else:
+            msg = "The indexes {0} were created and {1} were updated.".format(", ".join(missing), ", ".join(updated))
+        module.exit_json(changed=len(missing) + len(updated) > 0, msg=msg, indices=missing + updated, index_changes=index_changes)
+    elif state == 'absent':
+        if not existing:
+            module.exit_json(changed=False, msg="No indexes matching {0} exist.".format(", ".join(names)), indices=[])
+        if not module.check_mode:
+            for batch in elastic.batch_index_names(existing):
+                client.indices.delete(index=batch)
+        module.exit_json(changed=True, msg="{0} indexes were deleted.".format(len(existing)), indices=existing)
+    else:
+        if missing:
+            module.fail_json(msg="Cannot perform {0} action on indexes that do not exist: {1}".format(state, ", ".join(missing)))
+        if not existing:
+            module.fail_json(msg="Cannot perform {0} action, no indexes match {1}".format(state, ", ".join(names)))
+        method = {"closed": "close", "opened": "open"}.get(state, state)
+        class_method = getattr(client.indices, method)
+        stats = {}
+        for batch in elastic.batch_index_names(existing):
+            response = dict(class_method(index=batch))
+            if state == 'stats':
+                stats.update(response.get('indices', {}))
+        if state == 'stats':
+            module.exit_json(changed=True, msg="Stats from {0} indexes.".format(len(existing)), indices=existing, stats=stats)
+        module.exit_json(changed=True,
+                         msg="The '{0}' action was performed on {1} indexes.".format(method, len(existing)),
+                         indices=existing)
 
 
 # ================
@@ -127,15 +695,24 @@ def main():
         "flush_synced",
         "refresh",
         "stats",
-        "upgrade"
+        "upgrade",
+        "forcemerge",
+        "shrink",
+        "split",
+        "clone"
     ]
 
     argument_spec = elastic_common_argument_spec()
     argument_spec.update(
-        name=dict(type='str', required=True),
+        name=dict(type='list', elements='str', required=True),
         state=dict(type='str', choices=state_choices, default='present'),
         settings=dict(type='dict', default={}),
         mappings=dict(type='dict', default={}),
+        max_num_segments=dict(type='int'),
+        target=dict(type='str'),
+        max_concurrent=dict(type='int', default=1),
+        deadline=dict(type='int', default=0),
+        interval=dict(type='int', default=10),
         wait_for_active_shards=dict(type='str', default='0'),
     )
 
@@ -143,25 +720,41 @@ def main():
         argument_spec=argument_spec,
         supports_check_mode=True,
         required_together=[['login_user', 'login_password']],
+        required_if=[
+            ['state', 'shrink', ['target']],
+            ['state', 'split', ['target']],
+            ['state', 'clone', ['target']],
+        ],
     )
 
     if not elastic_found:
         module.fail_json(msg=missing_required_lib('elasticsearch'),
                          exception=E_IMP_ERR)
 
-    name = module.params['name']
+    names = module.params['name']
+    name = names[0]
     settings = module.params['settings']
     mappings = module.params['mappings']
     state = module.params['state']
 
+    if module.params['max_concurrent'] < 1:
+        module.fail_json(msg="max_concurrent must be at least 1.")
+
     # TODO main module logic
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
+        if state in ['forcemerge', 'shrink', 'split', 'clone']:
+            run_index_operations(module, elastic, client, names, state)
+
+        if len(names) > 1 or elastic.is_index_pattern(name):
+            manage_indices(module, elastic, client, names, state, {"settings": settings, "mappings": mappings})
+
         if state == 'present':
-            if client.indices.exists(index=name):
-                module.exit_json(changed=False, msg="The index '{0}' already exists.".format(name))
+            current = get_index(client, name)
+            if current is not None:
+                reconcile_index(module, client, name, current)
             else:
                 request_body = {"settings": settings, "mappings": mappings}
                 if module.check_mode:
@@ -170,11 +763,16 @@ def main():
                     response = dict(client.indices.create(index=name, body=request_body))
                 module.exit_json(changed=True, msg="The index '{0}' was created.".format(name), **response)
         elif state == 'absent':
-            if client.indices.exists(index=name):
-                if module.check_mode:
-                    response = {"acknowledged": True}
-                else:
+            if module.check_mode:
+                exists = client.indices.exists(index=name)
+                response = {"acknowledged": True}
+            else:
+                try:
                     response = dict(client.indices.delete(index=name))
+                    exists = True
+                except NotFoundError:
+                    exists = False
+            if exists:
                 module.exit_json(changed=True, msg="The index '{0}' was deleted.".format(name), **response)
             else:
                 module.exit_json(changed=False, msg="The index '{0}' does not exist.".format(name))
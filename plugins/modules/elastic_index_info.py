@@ -15,6 +15,9 @@ short_description: Returns info about Elasticsearch indexes.
 
 description:
   - Returns info about Elasticsearch indexes.
+  - Lists of names and wildcard patterns are resolved in a single request.
+  - Only the requested sections of the index info are returned.
+  - A lightweight inventory of many indexes can be fetched from the cat indices api.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -26,8 +29,54 @@ options:
   name:
     description:
       - The index name to get information about.
-    type: str
+      - A list of index names and wildcard patterns can be supplied.
+    type: list
+    elements: str
     required: True
+  features:
+    description:
+      - The sections of the index info to return.
+      - Only used when I(api=get).
+    type: list
+    elements: str
+    choices:
+      - aliases
+      - mappings
+      - settings
+    default:
+      - aliases
+      - mappings
+      - settings
+  filter_path:
+    description:
+      - Only return the parts of the response matching these paths e.g. C(*.settings.index.number_of_*).
+      - Overrides I(features) when I(api=get).
+    type: list
+    elements: str
+  api:
+    description:
+      - The api used to fetch the info.
+      - C(get) returns the aliases, mappings and settings of each index.
+      - C(cat) returns only I(columns) from the cat indices api, suitable for inventories of thousands of indexes.
+        Sizes are returned in bytes.
+    type: str
+    choices:
+      - get
+      - cat
+    default: get
+  columns:
+    description:
+      - The cat indices columns to return when I(api=cat).
+    type: list
+    elements: str
+    default:
+      - index
+      - health
+      - status
+      - pri
+      - rep
+      - docs.count
+      - store.size
   wait_for_active_shards:
     description:
       - A number controlling to how many active shards to wait for.
@@ -40,9 +89,54 @@ EXAMPLES = r'''
 - name: Get info for myindex
   community.elastic.elastic_index_info:
     name: myindex
+
+- name: Get only the settings of all log indexes
+  community.elastic.elastic_index_info:
+    name: "logs-*"
+    features:
+      - settings
+
+- name: Get the number of shards and replicas of two indexes
+  community.elastic.elastic_index_info:
+    name:
+      - myindex1
+      - myindex2
+    filter_path:
+      - "*.settings.index.number_of_*"
+
+- name: Get a lightweight inventory of every index
+  community.elastic.elastic_index_info:
+    name: "*"
+    api: cat
+    columns:
+      - index
+      - docs.count
+      - store.size
 '''
 
 RETURN = r'''
+info:
+  description:
+    - The index info keyed by index name.
+    - For backwards compatibility each index is also returned as a top level key,
+      except for index names that clash with the other keys of the result.
+  returned: when api is get and the indexes exist
+  type: dict
+indices:
+  description: The names of the indexes returned.
+  returned: when api is get
+  type: list
+  elements: str
+missing:
+  description: Index names that were supplied but do not exist.
+  returned: when a list of names or a pattern is supplied and api is get
+  type: list
+  elements: str
+cat_indices:
+  description: One dict of the requested columns per index.
+  returned: when api is cat
+  type: list
+  elements: dict
 '''
 
 
@@ -55,10 +149,74 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    NotFoundError
 )
 
 
+# Index names that are not also returned as top level keys
+RESULT_KEYS = ['changed', 'failed', 'msg', 'info', 'indices', 'missing', 'cat_indices',
+               'invocation', 'warnings', 'deprecations', 'exception', 'skipped']
+
+
+def index_results(response):
+    '''
+    Return the index info under info, and also as top level keys for
+    backwards compatibility, skipping names that clash with the result keys
+    '''
+    result = dict((k, v) for k, v in response.items() if k not in RESULT_KEYS and not k.startswith('ansible_'))
+    result['info'] = response
+    return result
+
+
+def get_filter_path(module):
+    '''
+    The filter_path that limits the get index response to the requested sections
+    '''
+    if module.params['filter_path'] is not None:
+        return ",".join(module.params['filter_path'])
+    features = module.params['features']
+    if sorted(features) == ['aliases', 'mappings', 'settings']:
+        return None
+    return ",".join(["*.{0}".format(feature) for feature in features])
+
+
+def get_indices(elastic, client, names, filter_path, ignore_unavailable):
+    '''
+    Get index info for the names in as few requests as possible
+    '''
+    response = {}
+    for batch in elastic.batch_index_names(names):
+        get_arg = {"index": batch}
+        if ignore_unavailable:
+            get_arg['ignore_unavailable'] = True
+        if filter_path is not None:
+            get_arg['filter_path'] = filter_path
+        response.update(dict(client.indices.get(**get_arg)))
+    return response
+
+
+def cat_indices(module, elastic, client, names):
+    '''
+    Get the requested columns for the names from the cat indices api
+    '''
+    rows = []
+    for batch in elastic.batch_index_names(names):
+        cat_arg = {
+            "index": batch,
+            "h": ",".join(module.params['columns']),
+            "format": "json",
+            "bytes": "b"
+        }
+        if module.params['filter_path'] is not None:
+            cat_arg['filter_path'] = ",".join(module.params['filter_path'])
+        response = client.cat.indices(**cat_arg)
+        if hasattr(response, 'body'):  # Required for Elasticsearch 8.x
+            response = response.body
+        rows.extend(response)
+    return rows
+
+
 # ================
 # Module execution
 #
@@ -67,7 +225,13 @@ def main():
 
     argument_spec = elastic_common_argument_spec()
     argument_spec.update(
-        name=dict(type='str', required=True),
+        name=dict(type='list', elements='str', required=True),
+        features=dict(type='list', elements='str', choices=['aliases', 'mappings', 'settings'],
+                      default=['aliases', 'mappings', 'settings']),
+        filter_path=dict(type='list', elements='str'),
+        api=dict(type='str', choices=['get', 'cat'], default='get'),
+        columns=dict(type='list', elements='str',
+                     default=['index', 'health', 'status', 'pri', 'rep', 'docs.count', 'store.size']),
         wait_for_active_shards=dict(type='str', default='0'),
     )
 
@@ -81,17 +245,39 @@ def main():
         module.fail_json(msg=missing_required_lib('elasticsearch'),
                          exception=E_IMP_ERR)
 
-    name = module.params['name']
+    names = module.params['name']
+    name = ",".join(names)
 
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
-        if client.indices.exists(index=name):
-            response = dict(client.indices.get(index=name))
-            module.exit_json(changed=False, msg="Info about index {0}.".format(name), **response)
-        else:
-            module.exit_json(changed=False, msg="The index {0} does not exist.".format(name))
+        if module.params['api'] == 'cat':
+            try:
+                rows = cat_indices(module, elastic, client, names)
+            except NotFoundError:
+                module.exit_json(changed=False, msg="The index {0} does not exist.".format(name), cat_indices=[])
+            module.exit_json(changed=False, msg="Info about {0} indexes.".format(len(rows)), cat_indices=rows)
+
+        filter_path = get_filter_path(module)
+        if len(names) == 1 and not elastic.is_index_pattern(names[0]):
+            try:
+                response = get_indices(elastic, client, names, filter_path, False)
+            except NotFoundError:
+                module.exit_json(changed=False, msg="The index {0} does not exist.".format(name))
+            module.exit_json(changed=False, msg="Info about index {0}.".format(name), indices=list(response.keys()),
+                             **index_results(response))
+
+        response = get_indices(elastic, client, names, filter_path, True)
+        existing = response
+        if filter_path is not None:  # The filter may drop whole index entries
+            existing = elastic.resolve_indices(client, names)
+        missing = [n for n in names if not elastic.is_index_pattern(n) and n not in existing]
+        module.exit_json(changed=False,
+                         msg="Info about {0} indexes.".format(len(response)),
+                         indices=sorted(response.keys()),
+                         missing=missing,
+                         **index_results(response))
     except Exception as excep:
         module.fail_json(msg='Elastic error: %s' % to_native(excep))
 
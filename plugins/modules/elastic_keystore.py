@@ -19,12 +19,17 @@ version_added: "0.0.1"
 description: >-
   Add and remove entries in the Elasticsearch keystore. Existing
   entries will not be decrypted, so the module will only compares based on the
-  name.
+  name, unless a fingerprint_file is used.
+
+extends_documentation_fragment:
+  - community.elastic.login_options
 
 options:
     name:
-        description: Keystore value to add or remove.
-        required: true
+        description:
+            - Keystore value to add or remove.
+            - Mutually exclusive with I(keys).
+        required: false
         type: str
     value:
         description: Data to be stored inside the entry. Required if state=present.
@@ -40,12 +45,64 @@ options:
         type: bool
         required: false
         default: false
-        description: "When used with state=present, existing entries with the same name will be replaced."
+        description:
+            - When used with state=present, existing entries with the same name will be replaced.
+            - With I(fingerprint_file), entries with a fingerprint are only replaced when the value differs.
     create_keystore:
         type: bool
         required: false
         default: true
         description: "Whether to create the keystore if one doesn't already exist."
+    fingerprint_file:
+        description:
+            - Path of a file, outside the keystore, holding a salted hash of the value of each entry added by this module.
+            - An existing entry with a fingerprint is replaced when its value differs, and skipped when it is
+              the same, regardless of I(force).
+            - Entries changed outside of this module are not detected.
+        required: false
+        type: path
+    reload_secure_settings:
+        description:
+            - Call the reload secure settings api once entries have been added or removed, so reloadable
+              settings such as s3 client credentials take effect without a restart.
+            - Uses the login options to connect and requires the elasticsearch python library.
+        required: false
+        type: bool
+        default: false
+    reload_nodes:
+        description:
+            - The nodes to reload secure settings on, when I(reload_secure_settings=true).
+            - By default only the node the module connects to.
+        required: false
+        type: str
+        default: _local
+    keys:
+        description:
+            - A list of entries to manage in a single task.
+            - The keystore is listed once, all adds are applied with one C(add) command reading the
+              values from stdin, and all removals with one C(remove) command.
+            - C(add) reads each value up to the first newline, so values containing a newline are rejected.
+              Add such entries from a file with the C(elasticsearch-keystore add-file) command instead.
+            - I(force) applies to every entry in the list.
+            - Mutually exclusive with I(name).
+        required: false
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description: Keystore value to add or remove.
+                required: true
+                type: str
+            value:
+                description: Data to be stored inside the entry. Required if state=present.
+                required: false
+                type: str
+            state:
+                type: str
+                required: false
+                default: "present"
+                choices: [ present, absent ]
+                description: "Whether the entry should exist or not."
 '''
 
 EXAMPLES = r'''
@@ -74,6 +131,28 @@ EXAMPLES = r'''
     name: es_pass
     value: "{{ vaulted_es_pass }}"
     create_keystore: no
+
+# Manage several keys with a single add and a single remove command
+- name: Seed the s3 client credentials
+  community.elastic.elastic_keystore:
+    keys:
+      - name: s3.client.default.access_key
+        value: "{{ vaulted_s3_access_key }}"
+      - name: s3.client.default.secret_key
+        value: "{{ vaulted_s3_secret_key }}"
+      - name: es_pass
+        state: absent
+
+# Rotate s3 credentials without a restart, skipping values that are unchanged
+- name: Rotate the s3 client credentials
+  community.elastic.elastic_keystore:
+    keys:
+      - name: s3.client.default.access_key
+        value: "{{ vaulted_s3_access_key }}"
+      - name: s3.client.default.secret_key
+        value: "{{ vaulted_s3_secret_key }}"
+    fingerprint_file: /etc/elasticsearch/keystore.fingerprints
+    reload_secure_settings: yes
 '''
 
 RETURN = r'''
@@ -87,9 +166,42 @@ message:
     type: str
     returned: always
     sample: 'Added es_pass to keystore'
+added:
+    description: The names of the entries added or replaced.
+    type: list
+    elements: str
+    returned: when keys is supplied
+    sample: ['s3.client.default.access_key', 's3.client.default.secret_key']
+removed:
+    description: The names of the entries removed.
+    type: list
+    elements: str
+    returned: when keys is supplied
+    sample: ['es_pass']
+reloaded_nodes:
+    description:
+        - The names of the nodes that reloaded their secure settings.
+        - In check mode, the names of the nodes that would be reloaded.
+    type: list
+    elements: str
+    returned: when reload_secure_settings is true and the keystore was changed
+    sample: ['es01']
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+
+from ansible_collections.community.elastic.plugins.module_utils.elastic_common import (
+    missing_required_lib,
+    elastic_found,
+    E_IMP_ERR,
+    elastic_common_argument_spec,
+    ElasticHelpers,
+    salted_hash,
+    salted_hash_matches,
+    load_hash_file,
+    save_hash_file
+)
 
 
 def parse_keys(data):
@@ -101,15 +213,125 @@ def parse_keys(data):
     return keys
 
 
+def needs_replace(module, fingerprints, name, value):
+    # Without a fingerprint the value of an existing entry is unknown
+    if fingerprints is not None and name in fingerprints:
+        return not salted_hash_matches(value, fingerprints[name])
+    return module.params['force']
+
+
+def record_fingerprints(module, fingerprints, added, removed):
+    if fingerprints is None or module.check_mode:
+        return
+    for name, value in added:
+        fingerprints[name] = salted_hash(value)
+    for name in removed:
+        fingerprints.pop(name, None)
+    save_hash_file(module.params['fingerprint_file'], fingerprints)
+
+
+def node_names(nodes):
+    return sorted(node.get('name', node_id) for node_id, node in nodes.items())
+
+
+def reload_secure_settings(module):
+    if not elastic_found:
+        module.fail_json(msg=missing_required_lib('elasticsearch'),
+                         exception=E_IMP_ERR)
+    try:
+        client = ElasticHelpers(module).connect()
+        if module.check_mode:
+            # Report the nodes a reload would be sent to without reloading
+            response = dict(client.nodes.info(node_id=module.params['reload_nodes']))
+            return node_names(response.get('nodes', {}))
+        response = dict(client.nodes.reload_secure_settings(node_id=module.params['reload_nodes']))
+    except Exception as excep:
+        module.fail_json(msg='Elastic error: %s' % to_native(excep))
+    nodes = response.get('nodes', {})
+    failures = dict((node.get('name', node_id), node['reload_exception'])
+                    for node_id, node in nodes.items() if 'reload_exception' in node)
+    if failures:
+        module.fail_json(msg="Failed to reload secure settings on %s" % (", ".join(sorted(failures))),
+                         failures=failures)
+    return node_names(nodes)
+
+
+def finish(module, fingerprints, added, removed, result):
+    record_fingerprints(module, fingerprints, added, removed)
+    if module.params['reload_secure_settings'] and result['changed']:
+        result['reloaded_nodes'] = reload_secure_settings(module)
+    module.exit_json(**result)
+
+
+def plan_keys(module, keys, fingerprints):
+    existing = set(key['name'] for key in keys)
+    add = []
+    remove = []
+    for entry in module.params['keys']:
+        if entry['state'] == 'present':
+            if entry['value'] is None:
+                module.fail_json(msg="A value is required for key %s when state=present." % (entry['name']))
+            if '\n' in entry['value']:
+                module.fail_json(msg="The value of key %s contains a newline, add it with elasticsearch-keystore add-file instead."
+                                 % (entry['name']))
+            if entry['name'] not in existing or needs_replace(module, fingerprints, entry['name'], entry['value']):
+                add.append(entry)
+        elif entry['name'] in existing:
+            remove.append(entry['name'])
+    return add, remove
+
+
+def add_keys(module, keystore_cmd, entries):
+    # add reads one value per line from stdin, values containing a newline are rejected by plan_keys
+    names = [entry['name'] for entry in entries]
+    data = "\n".join([entry['value'] for entry in entries])
+    rc, out, err = module.run_command("%s add -f -x %s" % (keystore_cmd, " ".join(names)), data=data)
+    if rc != 0:
+        module.fail_json(
+            msg="Failed to add %s to the keystore" % (", ".join(names)), rc=rc, err=err)
+
+
+def run_keys(module, keystore_cmd, keys, fingerprints, result):
+    add, remove = plan_keys(module, keys, fingerprints)
+    added = [entry['name'] for entry in add]
+    if not module.check_mode:
+        if add:
+            add_keys(module, keystore_cmd, add)
+        if remove:
+            rc, out, err = module.run_command("%s remove %s" % (keystore_cmd, " ".join(remove)))
+            if rc != 0:
+                module.fail_json(
+                    msg="Failed to remove %s from the keystore" % (", ".join(remove)), rc=rc, err=err)
+
+    if added or remove:
+        result['message'] = "Added %d and removed %d keys" % (len(added), len(remove))
+    else:
+        result['message'] = "Nothing to do."
+    result['changed'] = result['changed'] or len(added + remove) > 0
+    result['added'] = added
+    result['removed'] = remove
+    finish(module, fingerprints, [(entry['name'], entry['value']) for entry in add], remove, result)
+
+
 def run_module():
     module_args = dict(
-        name=dict(type='str', required=True),
+        name=dict(type='str', required=False),
         value=dict(type='str', required=False, no_log=True),
         state=dict(type='str', default='present',
                    choices=['absent', 'present']),
         force=dict(type='bool', required=False, default=False),
-        create_keystore=dict(type='bool', required=False, default=True)
+        create_keystore=dict(type='bool', required=False, default=True),
+        keys=dict(type='list', elements='dict', required=False, no_log=False, options=dict(
+            name=dict(type='str', required=True),
+            value=dict(type='str', required=False, no_log=True),
+            state=dict(type='str', default='present',
+                       choices=['absent', 'present']),
+        )),
+        fingerprint_file=dict(type='path', required=False),
+        reload_secure_settings=dict(type='bool', required=False, default=False),
+        reload_nodes=dict(type='str', required=False, default='_local'),
     )
+    module_args.update(elastic_common_argument_spec())
 
     result = dict(
         changed=False,
@@ -121,17 +343,29 @@ def run_module():
         argument_spec=module_args,
         supports_check_mode=True,
         required_if=[
-            ['state', 'present', ['value']]
+            ['state', 'present', ['value', 'keys'], True]
+        ],
+        required_one_of=[
+            ['name', 'keys']
+        ],
+        mutually_exclusive=[
+            ['name', 'keys'],
+            ['value', 'keys']
+        ],
+        required_together=[
+            ['login_user', 'login_password']
         ],
     )
 
     name = module.params['name']
     state = module.params['state']
-    force = module.params['force']
     msg = ''
     changed = result['changed']
     value = module.params['value']
     create = module.params['create_keystore']
+    fingerprints = None
+    if module.params['fingerprint_file'] is not None:
+        fingerprints = load_hash_file(module.params['fingerprint_file'])
 
     keystore_cmd = module.get_bin_path('elasticsearch-keystore', required=True, opt_dirs=['/usr/share/elasticsearch/bin'])
     rc, current_keys, err = module.run_command(
@@ -150,15 +384,25 @@ def run_module():
             msg="Failed executing elasticsearch-keystore command.", rc=rc, err=err)
 
     keys = parse_keys(current_keys)
+    if module.params['keys'] is not None:
+        run_keys(module, keystore_cmd, keys, fingerprints, result)
+
     key_exists = [key for key in keys if key['name'] == name]
+    replace = False
+    if key_exists and state == 'present':
+        replace = needs_replace(module, fingerprints, name, value)
+        if not replace:
+            if fingerprints is not None and name in fingerprints:
+                msg = "Key %s is already present with the same value." % (name)
+            else:
+                msg = "Key %s is already present. Not overwriting as force=no." % (name)
 
     if module.check_mode:
         if key_exists:
             if state == 'present':
-                if not force:
-                    msg = "Key %s is already present. Not overwriting as force=no." % (
-                        name)
-                    changed = False
+                if replace:
+                    changed = True
+                    msg = "Added %s to keystore" % (name)
             if state == 'absent':
                 changed = True
                 msg = "Removed %s from keystore" % (name)
@@ -178,8 +422,7 @@ def run_module():
 
     if state == 'present':
         if key_exists:
-            if not force:
-                msg = "Key %s is already present. Not overwriting as force=no." % (name)
+            if not replace:
                 changed = False
             else:
                 rc, out, err = module.run_command(
@@ -216,7 +459,9 @@ def run_module():
     result['message'] = msg
     result['changed'] = changed
 
-    module.exit_json(**result)
+    added = [(name, value)] if changed and state == 'present' else []
+    removed = [name] if changed and state == 'absent' else []
+    finish(module, fingerprints, added, removed, result)
 
 
 def main():
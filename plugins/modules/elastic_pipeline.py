@@ -47,11 +47,36 @@ options:
   state:
     description:
       - State of the pipeline
+      - I(state=simulate) runs sample documents through the pipeline and reports the result of each processor.
+        Nothing is changed.
+      - I(state=stats) reports the ingest statistics of the pipeline and its processors, summed across all nodes.
+        Nothing is changed.
     type: str
     choices:
       - present
       - absent
+      - simulate
+      - stats
     default: present
+  docs_file:
+    description:
+      - Only used with I(state=simulate) where it is required.
+      - Path to a file on the managed host containing the sample documents, one JSON document per line (NDJSON).
+      - Each line is either the document source or an object with a C(_source) key and optionally C(_index) and C(_id).
+      - When I(processors) is supplied that definition is simulated, otherwise the stored pipeline I(name) is.
+    type: path
+  batch_size:
+    description:
+      - Only used with I(state=simulate).
+      - The number of documents sent in each simulate request.
+    type: int
+    default: 100
+  max_failures:
+    description:
+      - Only used with I(state=simulate).
+      - The maximum number of processor failures returned in detail. All failures are counted.
+    type: int
+    default: 10
 '''
 
 EXAMPLES = r'''
@@ -71,9 +96,46 @@ EXAMPLES = r'''
   community.elastic.elastic_pipeline:
     name: my-pipeline-id
     state: absent
+
+- name: Run sample documents through a pipeline definition before deploying it
+  community.elastic.elastic_pipeline:
+    name: my-pipeline-id
+    state: simulate
+    docs_file: /tmp/sample-docs.ndjson
+    batch_size: 500
+    processors:
+      - grok:
+          field: message
+          patterns:
+            - "%{IP:client} %{WORD:method} %{URIPATHPARAM:request}"
+  register: simulation
+
+- name: Find the processors where a pipeline spends its time
+  community.elastic.elastic_pipeline:
+    name: my-pipeline-id
+    state: stats
+  register: pipeline_stats
 '''
 
 RETURN = r'''
+simulation:
+  description:
+    - Summary of the simulation.
+    - Contains docs, batches, failed_docs, took_ms, docs_per_second, processors and failures.
+    - Each processor has its position, type, tag and a count of documents per status
+      (success, error, error_ignored, skipped and dropped).
+    - The simulate api does not time each processor, took_ms is the time taken by the simulate requests.
+    - Each failure has the doc number, the processor and the error reason.
+  returned: when state is simulate
+  type: dict
+stats:
+  description:
+    - Ingest statistics of the pipeline summed across all nodes.
+    - Contains nodes, count, time_in_millis, current, failed and processors.
+    - Each processor has its position, name, type, count, time_in_millis, current, failed,
+      avg_time_in_millis and percent_of_time. Processors are sorted by time_in_millis, most expensive first.
+  returned: when state is stats
+  type: dict
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -88,7 +150,10 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     ElasticHelpers,
     NotFoundError
 )
+import io
 import json
+import os
+import time
 
 
 def check_param_state_present(module, param):
@@ -130,6 +195,158 @@ def pipeline_is_different(pipeline, module):
     return is_different
 
 
+def pipeline_body(module):
+    '''
+    Build the pipeline definition from the module parameters
+    '''
+    body = {}
+    for key in ["description", "processors", "version"]:
+        body = add_if_not_none(body, key, module)
+    return body
+
+
+def read_docs(docs_file, batch_size):
+    '''
+    Read the sample documents from a NDJSON file and yield them in batches
+    '''
+    batch = []
+    with io.open(docs_file, encoding="utf8") as ndjson:
+        for line_number, line in enumerate(ndjson, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                doc = json.loads(line)
+            except ValueError as excep:
+                raise ValueError("Invalid JSON on line {0} of {1}: {2}".format(line_number, docs_file, to_native(excep)))
+            if not isinstance(doc, dict):
+                raise ValueError("Line {0} of {1} is not a JSON object.".format(line_number, docs_file))
+            if '_source' not in doc:
+                doc = {"_source": doc}
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def simulate_batch(client, name, pipeline, docs):
+    '''
+    Run a batch of documents through the pipeline with the verbose simulate api.
+    When pipeline is None the stored pipeline is used.
+    '''
+    body = {"docs": docs}
+    if pipeline is not None:
+        body['pipeline'] = pipeline
+        return dict(client.ingest.simulate(body=body, verbose=True))
+    return dict(client.ingest.simulate(id=name, body=body, verbose=True))
+
+
+def error_reason(error):
+    '''
+    Return the reason of a processor error, including the root cause when there is one
+    '''
+    if not isinstance(error, dict):
+        return to_native(error)
+    reason = error.get('reason', error.get('type'))
+    root_cause = error.get('root_cause') or []
+    if root_cause and root_cause[0].get('reason') not in (None, reason):
+        reason = "{0}: {1}".format(reason, root_cause[0]['reason'])
+    return reason
+
+
+def summarise_batch(response, summary, max_failures):
+    '''
+    Add the per processor results of a verbose simulate response to the summary
+    '''
+    for doc in response.get('docs', []):
+        failed = 'error' in doc
+        for position, result in enumerate(doc.get('processor_results', [])):
+            key = "{0}:{1}".format(position, result.get('processor_type'))
+            processor = summary['processors'].get(key)
+            if processor is None:
+                processor = {
+                    "position": position,
+                    "type": result.get('processor_type'),
+                    "tag": result.get('tag'),
+                    "success": 0,
+                    "error": 0,
+                    "error_ignored": 0,
+                    "skipped": 0,
+                    "dropped": 0
+                }
+                summary['processors'][key] = processor
+            status = result.get('status', 'success')
+            processor[status] = processor.get(status, 0) + 1
+            if status == 'error':
+                failed = True
+                if len(summary['failures']) < max_failures:
+                    summary['failures'].append({
+                        "doc": summary['docs'],
+                        "processor": result.get('tag') or key,
+                        "error": error_reason(result.get('error'))
+                    })
+        if 'error' in doc and not doc.get('processor_results') and len(summary['failures']) < max_failures:
+            summary['failures'].append({"doc": summary['docs'], "processor": None, "error": error_reason(doc['error'])})
+        if failed:
+            summary['failed_docs'] += 1
+        summary['docs'] += 1
+
+
+def simulate_pipeline(module, client, name, pipeline):
+    '''
+    Simulate the pipeline with the documents of docs_file, one batch at a time
+    '''
+    summary = {"docs": 0, "batches": 0, "failed_docs": 0, "processors": {}, "failures": []}
+    took = 0.0
+    for docs in read_docs(module.params['docs_file'], module.params['batch_size']):
+        started = time.time()
+        response = simulate_batch(client, name, pipeline, docs)
+        took += time.time() - started
+        summary['batches'] += 1
+        summarise_batch(response, summary, module.params['max_failures'])
+    summary['took_ms'] = int(took * 1000)
+    summary['docs_per_second'] = round(summary['docs'] / took, 1) if took > 0 else None
+    summary['processors'] = sorted(summary['processors'].values(), key=lambda p: p['position'])
+    return summary
+
+
+def get_pipeline_stats(client, name):
+    '''
+    Sum the ingest statistics of the pipeline and its processors across all nodes.
+    Returns None when no node has statistics for the pipeline.
+    '''
+    counters = ["count", "time_in_millis", "current", "failed"]
+    response = dict(client.nodes.stats(metric='ingest', filter_path='nodes.*.ingest.pipelines'))
+    stats = dict((counter, 0) for counter in counters)
+    stats['nodes'] = 0
+    processors = []
+    for node in response.get('nodes', {}).values():
+        pipeline = node.get('ingest', {}).get('pipelines', {}).get(name)
+        if pipeline is None:
+            continue
+        stats['nodes'] += 1
+        for counter in counters:
+            stats[counter] += pipeline.get(counter, 0)
+        for position, entry in enumerate(pipeline.get('processors', [])):
+            for processor_name, processor in entry.items():
+                if position == len(processors):
+                    processors.append(dict(position=position,
+                                           name=processor_name,
+                                           type=processor.get('type', processor_name),
+                                           **dict((counter, 0) for counter in counters)))
+                for counter in counters:
+                    processors[position][counter] += processor.get('stats', {}).get(counter, 0)
+    if stats['nodes'] == 0:
+        return None
+    for processor in processors:
+        processor['avg_time_in_millis'] = round(float(processor['time_in_millis']) / processor['count'], 3) if processor['count'] else 0.0
+        processor['percent_of_time'] = round(100.0 * processor['time_in_millis'] / stats['time_in_millis'], 1) if stats['time_in_millis'] else 0.0
+    stats['processors'] = sorted(processors, key=lambda p: p['time_in_millis'], reverse=True)
+    return stats
+
+
 # ================
 # Module execution
 #
@@ -139,7 +356,9 @@ def main():
 
     state_choices = [
         "present",
-        "absent"
+        "absent",
+        "simulate",
+        "stats"
     ]
 
     argument_spec = elastic_common_argument_spec()
@@ -150,12 +369,18 @@ def main():
         processors=dict(type='list', elements='dict'),
         version=dict(type='int'),
         state=dict(type='str', choices=state_choices, default='present'),
+        docs_file=dict(type='path'),
+        batch_size=dict(type='int', default=100),
+        max_failures=dict(type='int', default=10),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
         required_together=[['login_user', 'login_password']],
+        required_if=[
+            ['state', 'simulate', ['docs_file']],
+        ],
     )
 
     if not elastic_found:
@@ -176,12 +401,37 @@ def main():
     #        module.fail_json(msg="There are invalid keys in the groups dictionary.")
     #    elif not isinstance(metrics, list):
     #        module.fail_json(msg="The metrics key does not contain a list.")
+    if state == 'simulate':
+        if not os.path.isfile(module.params['docs_file']):
+            module.fail_json(msg="The docs_file {0} does not exist.".format(module.params['docs_file']))
+        if module.params['batch_size'] < 1:
+            module.fail_json(msg="batch_size must be greater than 0.")
 
     # TODO main module logic
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
+        if state == "simulate":
+            definition = None
+            if module.params['processors'] is not None:
+                definition = pipeline_body(module)
+            elif get_pipeline(client, name) is None:
+                module.fail_json(msg="The pipeline {0} does not exist and no processors were supplied to simulate.".format(name))
+            try:
+                simulation = simulate_pipeline(module, client, name, definition)
+            except ValueError as excep:
+                module.fail_json(msg=to_native(excep))
+            msg = "Simulated the pipeline {0} with {1} document(s), {2} failed.".format(name,
+                                                                                        simulation['docs'],
+                                                                                        simulation['failed_docs'])
+            module.exit_json(changed=False, msg=msg, simulation=simulation)
+        elif state == "stats":
+            stats = get_pipeline_stats(client, name)
+            if stats is None:
+                module.exit_json(changed=False, msg="No ingest statistics were found for the pipeline {0}.".format(name))
+            module.exit_json(changed=False, msg="Retrieved the ingest statistics of the pipeline {0}.".format(name), stats=stats)
+
         pipeline = get_pipeline(client, name)
 
         # We can probably refector this code to reduce by 50% by only checking when we actually change something
@@ -213,14 +463,7 @@ def main():
                     module.exit_json(changed=False, msg="The pipeline {0} does not exist.".format(name))
             else:
                 if state == "present":
-                    body = {}
-                    body_keys = [
-                        "description",
-                        "processors",
-                        "version"
-                    ]
-                    for key in body_keys:
-                        body = add_if_not_none(body, key, module)
+                    body = pipeline_body(module)
                     response = client.ingest.put_pipeline(id=name,
                                                           body=body,
                                                           headers=None)
@@ -16,6 +16,8 @@ short_description: Copies documents from a source to a destination.
 description:
   - Copies documents from a source to a destination.
   - The source and destination can be any pre-existing index, index alias, or data stream.
+  - Many copies can be run as background tasks with bounded concurrency using I(pairs)
+    or a I(dest) template.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -27,18 +29,163 @@ options:
   source:
     description:
       - The index to copy documents from.
+      - When I(dest) is a template this may be a wildcard pattern or comma separated list of indexes.
+      - Required unless I(pairs) is supplied.
     type: str
-    required: True
   dest:
     description:
       - The index to copy documents to.
+      - If this contains C({index}) it is a template. Each index matching I(source) is copied
+        to the template with C({index}) replaced by the source index name.
+      - Required unless I(pairs) is supplied.
     type: str
-    required: True
+  pairs:
+    description:
+      - A list of copies to perform, each a dict with source and dest keys.
+      - Mutually exclusive with I(source) and I(dest).
+    type: list
+    elements: dict
+    suboptions:
+      source:
+        description:
+          - The index to copy documents from.
+        type: str
+        required: true
+      dest:
+        description:
+          - The index to copy documents to.
+        type: str
+        required: true
+  max_concurrent:
+    description:
+      - Only used with I(pairs) or a I(dest) template.
+      - The maximum number of copy tasks that run at the same time.
+    type: int
+    default: 4
   wait_for_completion:
     description:
       - Wait for the command to cpmplete before continuing.
+      - When false the copy runs as a background task. See I(deadline) to follow its progress.
     type: bool
     default: False
+  query:
+    description:
+      - Only copy the documents matching this query, written in the Elasticsearch query DSL.
+    type: dict
+  source_includes:
+    description:
+      - Only copy these fields of the source documents.
+      - Wildcards are supported.
+    type: list
+    elements: str
+  source_excludes:
+    description:
+      - Do not copy these fields of the source documents.
+      - Wildcards are supported.
+    type: list
+    elements: str
+  max_docs:
+    description:
+      - The maximum number of documents to copy.
+    type: int
+  pipeline:
+    description:
+      - The ingest pipeline used to process the documents before they are written to the destination.
+    type: str
+  script:
+    description:
+      - A script used to modify the documents as they are copied.
+      - Supplied as a dict containing source, and optionally lang and params.
+    type: dict
+  remote:
+    description:
+      - Copy the documents from a remote cluster.
+      - The remote host must be allowed in the reindex.remote.whitelist setting of the destination cluster.
+    type: dict
+    suboptions:
+      host:
+        description:
+          - The URL of the remote cluster e.g. https://otherhost:9200.
+        type: str
+        required: true
+      username:
+        description:
+          - The username used to authenticate with the remote cluster.
+        type: str
+      password:
+        description:
+          - The password used to authenticate with the remote cluster.
+        type: str
+      headers:
+        description:
+          - Additional headers sent to the remote cluster.
+        type: dict
+      socket_timeout:
+        description:
+          - The remote socket read timeout e.g. 30s.
+        type: str
+      connect_timeout:
+        description:
+          - The remote connection timeout e.g. 30s.
+        type: str
+  slices:
+    description:
+      - The number of slices the copy is divided into.
+      - Each slice is processed in parallel by its own scroll.
+      - Not supported with I(remote).
+      - Set to C(auto) to let Elasticsearch choose, usually one slice per shard.
+    type: str
+  size:
+    description:
+      - The number of documents to fetch per scroll batch.
+      - Elasticsearch defaults to 1000.
+    type: int
+  requests_per_second:
+    description:
+      - Throttle the copy to this number of sub-requests per second.
+      - Set to -1 to disable throttling.
+    type: float
+  verify:
+    description:
+      - Verify the copy once it has completed.
+      - The destination is counted before the copy. Once the copy has completed the destination is refreshed
+        and the number of documents added to it must equal the number of matching source documents copied,
+        less the documents that replaced existing ones.
+      - A random sample of source documents is fetched and their ids looked up in the destination.
+      - When I(max_docs) is set the sample is drawn from the destination instead and its ids looked up in the source,
+        as only part of the source was copied. The sample is skipped when the destination held documents before the copy.
+      - A checksum over the sorted sample is compared between source and destination. The checksum is
+        skipped when I(script), I(pipeline), I(source_includes) or I(source_excludes) change the documents.
+      - The module fails if verification fails.
+      - Cannot be used with I(remote).
+    type: bool
+    default: false
+  verify_sample_rate:
+    description:
+      - The fraction of source documents to sample when I(verify=true).
+    type: float
+    default: 0.01
+  verify_max_docs:
+    description:
+      - The maximum number of documents sampled when I(verify=true), regardless of I(verify_sample_rate).
+      - Set to 0 to only compare document counts.
+    type: int
+    default: 1000
+  deadline:
+    description:
+      - Only used when I(wait_for_completion=false).
+      - Poll the tasks api for up to this many seconds after the task has started.
+      - Progress of the task is returned when the deadline is reached. The task itself keeps running.
+      - Set to 0 to return as soon as the task has started.
+      - With I(pairs) or a I(dest) template the tasks are always followed, and 0 means no deadline.
+        Copies not yet started when the deadline is reached are reported as pending.
+    type: int
+    default: 0
+  interval:
+    description:
+      - The number of seconds to sleep between polls of the tasks api.
+    type: int
+    default: 10
 '''
 
 EXAMPLES = r'''
@@ -46,6 +193,72 @@ EXAMPLES = r'''
   community.elastic.elastic_reindex:
     source: myIndex1
     dest: myIndex2
+
+- name: Copy a large index with parallel slices and follow progress for up to an hour
+  community.elastic.elastic_reindex:
+    source: myIndex1
+    dest: myIndex2
+    slices: auto
+    size: 5000
+    requests_per_second: 2000
+    deadline: 3600
+    interval: 30
+
+- name: Copy the last 30 days of a subset of fields through a pipeline
+  community.elastic.elastic_reindex:
+    source: logs
+    dest: logs-recent
+    query:
+      range:
+        "@timestamp":
+          gte: "now-30d/d"
+    source_includes:
+      - "@timestamp"
+      - message
+      - host.*
+    pipeline: my-pipeline
+    wait_for_completion: yes
+
+- name: Copy documents from a remote cluster, renaming a field
+  community.elastic.elastic_reindex:
+    source: myIndex1
+    dest: myIndex2
+    max_docs: 100000
+    remote:
+      host: https://otherhost:9200
+      username: elastic
+      password: "{{ remote_password }}"
+      socket_timeout: 1m
+      connect_timeout: 10s
+    script:
+      lang: painless
+      source: "ctx._source.new_name = ctx._source.remove('old_name')"
+
+- name: Copy all daily indexes to a new mapping, eight at a time
+  community.elastic.elastic_reindex:
+    source: "logs-2026.*"
+    dest: "{index}-v2"
+    max_concurrent: 8
+    slices: auto
+    interval: 30
+
+- name: Copy a list of indexes
+  community.elastic.elastic_reindex:
+    pairs:
+      - source: myIndex1
+        dest: myNewIndex1
+      - source: myIndex2
+        dest: myNewIndex2
+    max_concurrent: 2
+
+- name: Copy an index and verify the copy using a sample of at most 5000 documents
+  community.elastic.elastic_reindex:
+    source: myIndex1
+    dest: myIndex2
+    wait_for_completion: yes
+    verify: yes
+    verify_sample_rate: 0.001
+    verify_max_docs: 5000
 '''
 
 RETURN = r'''
@@ -85,6 +298,39 @@ took:
   description: How long the copy took in ms.
   returned: on success when wait_for_completion is true
   type: int
+completed:
+  description: Whether the background copy task completed before the deadline.
+  returned: when deadline is greater than 0
+  type: bool
+progress:
+  description:
+    - Progress of the background copy task.
+    - Contains total, done, percent, batches, elapsed_seconds, docs_per_sec, eta_seconds and requests_per_second.
+  returned: when deadline is greater than 0
+  type: dict
+results:
+  description:
+    - The outcome of each copy when using I(pairs) or a I(dest) template.
+    - Each item contains source, dest, status and, once started, task.
+    - status is one of completed, failed, running or pending.
+    - Completed copies also contain created, updated, deleted, failed, took and batches.
+  returned: when pairs or a dest template is used
+  type: list
+  elements: dict
+verification:
+  description:
+    - The outcome of the verification of the copy.
+    - Contains verified, source_count, dest_count_before, dest_count, expected_count, added, count_ok, sampled,
+      missing, missing_ids, checksum_match, source_checksum and dest_checksum.
+    - With I(pairs) or a I(dest) template each item of results contains its own verification.
+  returned: when verify is true and the copy completed
+  type: dict
+totals:
+  description:
+    - Totals across all copies when using I(pairs) or a I(dest) template.
+    - Contains the number of copies per status along with the summed document counts.
+  returned: when pairs or a dest template is used
+  type: dict
 '''
 
 
@@ -98,8 +344,290 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
+    NotFoundError,
     __version__
 )
+import hashlib
+import json
+import math
+import time
+
+
+def build_reindex_body(module, source, dest):
+    '''
+    Build the reindex request body
+    '''
+    body = {"source": {"index": source}, "dest": {"index": dest}}
+    if module.params['size'] is not None:
+        body['source']['size'] = module.params['size']
+    if module.params['query'] is not None:
+        body['source']['query'] = module.params['query']
+    includes = module.params['source_includes']
+    excludes = module.params['source_excludes']
+    if excludes is not None:
+        body['source']['_source'] = {"includes": includes or [], "excludes": excludes}
+    elif includes is not None:
+        body['source']['_source'] = includes
+    if module.params['remote'] is not None:
+        remote = {}
+        for key, value in module.params['remote'].items():
+            if value is not None:
+                remote[key] = value
+        body['source']['remote'] = remote
+    if module.params['pipeline'] is not None:
+        body['dest']['pipeline'] = module.params['pipeline']
+    if module.params['script'] is not None:
+        body['script'] = module.params['script']
+    if module.params['max_docs'] is not None:
+        body['max_docs'] = module.params['max_docs']
+    return body
+
+
+def build_reindex_params(module, wait_for_completion):
+    '''
+    Build the reindex query parameters
+    '''
+    params = {"wait_for_completion": wait_for_completion}
+    slices = module.params['slices']
+    if slices is not None:
+        if slices == 'auto':
+            params['slices'] = slices
+        else:
+            try:
+                params['slices'] = int(slices)
+            except ValueError:
+                module.fail_json(msg="slices must be an integer or 'auto': {0}".format(slices))
+    if module.params['requests_per_second'] is not None:
+        params['requests_per_second'] = module.params['requests_per_second']
+    return params
+
+
+def reindex(client, body, params):
+    '''
+    Call the reindex api with the given body and query parameters
+    '''
+    if __version__ >= (8, 0, 0):
+        reindex_arg = dict(body)
+        reindex_arg.update(params)
+        result = dict(client.reindex(**reindex_arg))
+    else:
+        result = dict(client.reindex(body, **params))
+    return result
+
+
+def result_summary(result):
+    '''
+    The document counts from a completed reindex response
+    '''
+    return dict(created=result['created'],
+                updated=result['updated'],
+                deleted=result['deleted'],
+                failed=len(result['failures']),
+                took=result['took'],
+                batches=result['batches'])
+
+
+def sample_checksum(docs):
+    '''
+    A checksum over the documents, streamed in _id order
+    '''
+    checksum = hashlib.sha256()
+    for doc in sorted(docs, key=lambda d: d['_id']):
+        checksum.update(json.dumps([doc['_id'], doc.get('_source')], sort_keys=True).encode('utf-8'))
+    return checksum.hexdigest()
+
+
+def doc_count(client, index):
+    '''
+    The number of documents in the index, 0 when it does not exist yet
+    '''
+    try:
+        client.indices.refresh(index=index)
+        return dict(client.count(index=index))['count']
+    except NotFoundError:
+        return 0
+
+
+def sample_docs(elastic, client, index, query, sample_size):
+    '''
+    Fetch a random sample of the documents of index matching query
+    '''
+    sample_query = {
+        "size": sample_size,
+        "query": {
+            "function_score": {
+                "query": query,
+                "random_score": {"seed": int(time.time()), "field": "_seq_no"},
+                "boost_mode": "replace"
+            }
+        }
+    }
+    return dict(elastic.query(client, index, sample_query))['hits']['hits']
+
+
+def lookup_docs(elastic, client, index, ids):
+    '''
+    Fetch the documents of index with the given ids.
+    An ids query is used so index may be a pattern or alias.
+    '''
+    lookup_query = {"size": len(ids), "query": {"ids": {"values": ids}}}
+    return dict(elastic.query(client, index, lookup_query))['hits']['hits']
+
+
+def verify_copy(module, elastic, client, source, dest, dest_count_before, updated):
+    '''
+    Compare the number of documents added to dest with the number of source
+    documents copied, then check a random sample of documents exists unchanged
+    in both indexes.
+    '''
+    query = module.params['query'] or {"match_all": {}}
+    source_count = dict(client.count(index=source, body={"query": query}))['count']
+    dest_count = doc_count(client, dest)
+    expected_count = source_count
+    if module.params['max_docs'] is not None:
+        expected_count = min(source_count, module.params['max_docs'])
+    verification = {
+        "source_count": source_count,
+        "dest_count_before": dest_count_before,
+        "dest_count": dest_count,
+        "expected_count": expected_count,
+        "added": dest_count - dest_count_before,
+        "count_ok": dest_count - dest_count_before == expected_count - updated,
+        "sampled": 0,
+        "missing": 0,
+        "missing_ids": [],
+        "checksum_match": None,
+        "source_checksum": None,
+        "dest_checksum": None,
+    }
+
+    sample_size = min(module.params['verify_max_docs'],
+                      int(math.ceil(expected_count * module.params['verify_sample_rate'])))
+    if module.params['max_docs'] is not None and dest_count_before > 0:
+        sample_size = 0
+    if sample_size > 0:
+        if module.params['max_docs'] is None:
+            source_docs = sample_docs(elastic, client, source, query, sample_size)
+            ids = [doc['_id'] for doc in source_docs]
+            dest_docs = lookup_docs(elastic, client, dest, ids)
+            found = set([doc['_id'] for doc in dest_docs])
+        else:
+            dest_docs = sample_docs(elastic, client, dest, {"match_all": {}}, sample_size)
+            ids = [doc['_id'] for doc in dest_docs]
+            source_docs = lookup_docs(elastic, client, source, ids)
+            found = set([doc['_id'] for doc in source_docs])
+        missing_ids = [doc_id for doc_id in ids if doc_id not in found]
+        verification['sampled'] = len(ids)
+        verification['missing'] = len(missing_ids)
+        verification['missing_ids'] = missing_ids[:20]
+        transformed = [k for k in ['script', 'pipeline', 'source_includes', 'source_excludes'] if module.params[k] is not None]
+        if not transformed:
+            verification['source_checksum'] = sample_checksum(source_docs)
+            verification['dest_checksum'] = sample_checksum(dest_docs)
+            verification['checksum_match'] = verification['source_checksum'] == verification['dest_checksum']
+
+    verification['verified'] = verification['count_ok'] and verification['missing'] == 0 \
+        and verification['checksum_match'] is not False
+    return verification
+
+
+def resolve_pairs(client, source, dest):
+    '''
+    Expand a source pattern into source/dest pairs using the dest template.
+    The indexes are resolved with a single request.
+    '''
+    indices = sorted(dict(client.indices.get_alias(index=source)).keys())
+    return [{"source": index, "dest": dest.replace('{index}', index)} for index in indices]
+
+
+def batch_reindex(module, elastic, client, pairs):
+    '''
+    Run the copies as background tasks, at most max_concurrent at a time,
+    and follow them via the tasks api until they complete or the deadline is reached.
+    '''
+    max_concurrent = module.params['max_concurrent']
+    deadline = module.params['deadline']
+    interval = module.params['interval']
+    pending = list(pairs)
+    running = {}
+    results = []
+    dest_counts = {}
+    started = time.time()
+    while pending or running:
+        while pending and len(running) < max_concurrent:
+            pair = pending.pop(0)
+            entry = {"source": pair['source'], "dest": pair['dest']}
+            results.append(entry)
+            try:
+                if module.params['verify']:
+                    dest_counts[pair['dest']] = doc_count(client, pair['dest'])
+                body = build_reindex_body(module, pair['source'], pair['dest'])
+                params = build_reindex_params(module, False)
+                response = reindex(client, body, params)
+                entry['task'] = response['task']
+                entry['status'] = "running"
+                running[response['task']] = entry
+            except Exception as excep:
+                entry['status'] = "failed"
+                entry['error'] = to_native(excep)
+        if not running:
+            continue
+        if deadline > 0 and time.time() - started + interval > deadline:
+            break
+        time.sleep(interval)
+        for task_id, entry in list(running.items()):
+            task = elastic.get_task(client, task_id)
+            if task.get('completed', False):
+                del running[task_id]
+                entry.pop('progress', None)
+                if 'error' in task:
+                    entry['status'] = "failed"
+                    entry['error'] = task['error']
+                else:
+                    entry.update(result_summary(task.get('response', {})))
+                    if entry['failed'] > 0:
+                        entry['status'] = "failed"
+                    else:
+                        entry['status'] = "completed"
+                        if module.params['verify']:
+                            entry['verification'] = verify_copy(module, elastic, client, entry['source'], entry['dest'],
+                                                                dest_counts[entry['dest']], entry['updated'])
+                            if not entry['verification']['verified']:
+                                entry['status'] = "failed"
+            else:
+                entry['progress'] = elastic.task_progress(task)
+    for pair in pending:
+        results.append({"source": pair['source'], "dest": pair['dest'], "status": "pending"})
+    return results
+
+
+def batch_totals(results):
+    '''
+    Sum up the outcome of a batch of copies
+    '''
+    totals = dict(pairs=len(results), completed=0, failed=0, running=0, pending=0,
+                  created=0, updated=0, deleted=0, failed_docs=0, batches=0)
+    for entry in results:
+        totals[entry['status']] += 1
+        for key in ['created', 'updated', 'deleted', 'batches']:
+            totals[key] += entry.get(key, 0)
+        totals['failed_docs'] += entry.get('failed', 0)
+    return totals
+
+
+def exit_copy(module, elastic, client, source, dest, summary, dest_count_before):
+    '''
+    Exit after a completed copy, verifying it first when requested
+    '''
+    if module.params['verify']:
+        summary['verification'] = verify_copy(module, elastic, client, source, dest, dest_count_before, summary['updated'])
+        if not summary['verification']['verified']:
+            module.fail_json(changed=True,
+                             msg="The copy from {0} to {1} failed verification.".format(source, dest),
+                             **summary)
+    module.exit_json(changed=True,
+                     msg="The copy from {0} to {1} was successful.".format(source, dest),
+                     **summary)
 
 
 # ================
@@ -111,16 +639,50 @@ def main():
 
     argument_spec = elastic_common_argument_spec()
     argument_spec.update(
-        source=dict(type='str', required=True),
-        dest=dict(type='str', required=True),
+        source=dict(type='str'),
+        dest=dict(type='str'),
+        pairs=dict(type='list', elements='dict', options=dict(
+            source=dict(type='str', required=True),
+            dest=dict(type='str', required=True),
+        )),
+        max_concurrent=dict(type='int', default=4),
+        verify=dict(type='bool', default=False),
+        verify_sample_rate=dict(type='float', default=0.01),
+        verify_max_docs=dict(type='int', default=1000),
         wait_for_completion=dict(type='bool', default=False),
+        query=dict(type='dict'),
+        source_includes=dict(type='list', elements='str'),
+        source_excludes=dict(type='list', elements='str'),
+        max_docs=dict(type='int'),
+        pipeline=dict(type='str'),
+        script=dict(type='dict'),
+        remote=dict(type='dict', options=dict(
+            host=dict(type='str', required=True),
+            username=dict(type='str'),
+            password=dict(type='str', no_log=True),
+            headers=dict(type='dict'),
+            socket_timeout=dict(type='str'),
+            connect_timeout=dict(type='str'),
+        )),
+        slices=dict(type='str'),
+        size=dict(type='int'),
+        requests_per_second=dict(type='float'),
+        deadline=dict(type='int', default=0),
+        interval=dict(type='int', default=10),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=False,
         required_together=[
-            ['login_user', 'login_password']
+            ['login_user', 'login_password'],
+            ['source', 'dest'],
+        ],
+        required_one_of=[
+            ['source', 'pairs'],
+        ],
+        mutually_exclusive=[
+            ['source', 'pairs'],
         ],
     )
 
@@ -131,33 +693,75 @@ def main():
     source = module.params['source']
     dest = module.params['dest']
     wait_for_completion = module.params['wait_for_completion']
+    deadline = module.params['deadline']
+    interval = module.params['interval']
+    pairs = module.params['pairs']
+
+    if module.params['remote'] is not None and module.params['slices'] is not None:
+        module.fail_json(msg="slices cannot be used when copying from a remote cluster.")
+    if module.params['remote'] is not None and dest is not None and '{index}' in dest:
+        module.fail_json(msg="A dest template cannot be used when copying from a remote cluster, supply pairs instead.")
+    if module.params['remote'] is not None and module.params['verify']:
+        module.fail_json(msg="verify cannot be used when copying from a remote cluster.")
+    if module.params['verify_sample_rate'] < 0 or module.params['verify_sample_rate'] > 1:
+        module.fail_json(msg="verify_sample_rate must be between 0 and 1.")
+    if module.params['max_concurrent'] < 1:
+        module.fail_json(msg="max_concurrent must be at least 1.")
 
     try:
 
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
-        reindex_arg = {"source": {"index": source}, "dest": {"index": dest}}
-        if __version__ >= (8, 0, 0):
-            reindex_arg['wait_for_completion'] = wait_for_completion
-            result = dict(client.reindex(**reindex_arg))
-        else:
-            result = dict(client.reindex(reindex_arg, wait_for_completion=wait_for_completion))
+        if pairs is None and '{index}' in dest:
+            pairs = resolve_pairs(client, source, dest)
+            if not pairs:
+                module.exit_json(changed=False, msg="No indexes match {0}.".format(source), results=[], totals=batch_totals([]))
+
+        if pairs is not None:
+            results = batch_reindex(module, elastic, client, pairs)
+            totals = batch_totals(results)
+            msg = "{0} of {1} copies completed, {2} failed, {3} running and {4} pending.".format(totals['completed'],
+                                                                                                 totals['pairs'],
+                                                                                                 totals['failed'],
+                                                                                                 totals['running'],
+                                                                                                 totals['pending'])
+            if totals['failed'] > 0:
+                module.fail_json(changed=True, msg=msg, results=results, totals=totals)
+            module.exit_json(changed=True, msg=msg, results=results, totals=totals)
+
+        dest_count_before = None
+        if module.params['verify']:
+            dest_count_before = doc_count(client, dest)
+        body = build_reindex_body(module, source, dest)
+        params = build_reindex_params(module, wait_for_completion)
+        result = reindex(client, body, params)
         if isinstance(result, dict) and 'task' in list(result.keys()):
+            if deadline > 0:
+                task, completed = elastic.wait_for_task(client, result['task'], deadline, interval)
+                progress = elastic.task_progress(task)
+                if completed:
+                    response = task.get('response', {})
+                    if 'error' in task:
+                        module.fail_json(msg="The copy task from {0} to {1} failed.".format(source, dest),
+                                         task=result['task'],
+                                         error=task['error'])
+                    summary = result_summary(response)
+                    summary.update(task=result['task'], completed=True, progress=progress)
+                    exit_copy(module, elastic, client, source, dest, summary, dest_count_before)
+                else:
+                    msg = "The copy task from {0} to {1} is still running.".format(source, dest)
+                    module.exit_json(changed=True,
+                                     msg=msg,
+                                     task=result['task'],
+                                     completed=False,
+                                     progress=progress)
             msg = "The copy task from {0} to {1} has been started.".format(source, dest)
             module.exit_json(changed=True,
                              msg=msg,
                              **result)
         elif isinstance(result, dict) and 'took' in list(result.keys()):
-            msg = "The copy from {0} to {1} was successful.".format(source, dest)
-            module.exit_json(changed=True,
-                             msg=msg,
-                             created=result['created'],
-                             updated=result['updated'],
-                             deleted=result['deleted'],
-                             failed=len(result['failures']),
-                             took=result['took'],
-                             batches=result['batches'])
+            exit_copy(module, elastic, client, source, dest, result_summary(result), dest_count_before)
         else:
             msg = "Copy failed."
             if result is None:
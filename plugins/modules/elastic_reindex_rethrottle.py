@@ -0,0 +1,329 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Rhys Campbell (@rhysmeister) <rhyscampbell@bluewin.ch>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: elastic_reindex_rethrottle
+
+short_description: Change the throttle of a running reindex task.
+
+description:
+  - Change the requests_per_second of a running reindex task.
+  - The task can be identified by its task id or by the source and destination of the copy.
+  - A schedule of throttle windows can be applied for the lifetime of the task.
+
+author: Rhys Campbell (@rhysmeister)
+version_added: "1.5.0"
+
+extends_documentation_fragment:
+  - community.elastic.login_options
+
+options:
+  task_id:
+    description:
+      - The id of the reindex task, as returned by M(community.elastic.elastic_reindex).
+      - Mutually exclusive with I(source) and I(dest).
+    type: str
+  source:
+    description:
+      - The source index of the reindex task.
+      - Used with I(dest) to find the running task when I(task_id) is not known.
+    type: str
+  dest:
+    description:
+      - The destination index of the reindex task.
+    type: str
+  requests_per_second:
+    description:
+      - The throttle to apply to the task.
+      - Set to -1 to disable throttling.
+      - When I(schedule) is supplied this is the throttle applied outside of the schedule windows.
+    type: float
+  schedule:
+    description:
+      - A list of throttle windows.
+      - The module keeps running and applies the throttle of the current window
+        until the task completes or I(deadline) is reached.
+      - Windows are evaluated in the local time of the managed host. The first matching window wins.
+    type: list
+    elements: dict
+    suboptions:
+      start:
+        description:
+          - Start of the window in HH:MM format.
+        type: str
+        required: true
+      end:
+        description:
+          - End of the window in HH:MM format.
+          - May be earlier than I(start) for windows that span midnight.
+        type: str
+        required: true
+      requests_per_second:
+        description:
+          - The throttle to apply during the window.
+        type: float
+        required: true
+  deadline:
+    description:
+      - Only used with I(schedule).
+      - Maximum number of seconds to keep applying the schedule.
+    type: int
+    default: 86400
+  interval:
+    description:
+      - Only used with I(schedule).
+      - The number of seconds to sleep between checks of the task and schedule.
+    type: int
+    default: 60
+'''
+
+EXAMPLES = r'''
+- name: Start a background copy
+  community.elastic.elastic_reindex:
+    source: myIndex1
+    dest: myIndex2
+    requests_per_second: 500
+  register: copy
+
+- name: Speed the copy up
+  community.elastic.elastic_reindex_rethrottle:
+    task_id: "{{ copy.task }}"
+    requests_per_second: -1
+
+- name: Slow down the copy from myIndex1 to myIndex2
+  community.elastic.elastic_reindex_rethrottle:
+    source: myIndex1
+    dest: myIndex2
+    requests_per_second: 100
+
+- name: Throttle during business hours and run flat out at night until the copy completes
+  community.elastic.elastic_reindex_rethrottle:
+    task_id: "{{ copy.task }}"
+    requests_per_second: -1
+    schedule:
+      - start: "08:00"
+        end: "18:00"
+        requests_per_second: 200
+    deadline: 172800
+    interval: 300
+  async: 172800
+  poll: 0
+'''
+
+RETURN = r'''
+msg:
+  description: A short message describing what happened.
+  returned: always
+  type: str
+task:
+  description: The id of the reindex task.
+  returned: always
+  type: str
+requests_per_second:
+  description: The throttle of the task when the module finished.
+  returned: always
+  type: float
+completed:
+  description: Whether the task had completed when the module finished.
+  returned: always
+  type: bool
+throttle_changes:
+  description: List of the throttle changes made, each with time, old_value and new_value.
+  returned: always
+  type: list
+  elements: dict
+'''
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+
+from ansible_collections.community.elastic.plugins.module_utils.elastic_common import (
+    missing_required_lib,
+    elastic_found,
+    E_IMP_ERR,
+    elastic_common_argument_spec,
+    ElasticHelpers
+)
+import time
+from datetime import datetime
+
+
+def find_reindex_task(client, source, dest):
+    '''
+    Find the id of the running reindex task copying source to dest.
+    Slice sub-tasks are ignored, only the parent task can be rethrottled.
+    '''
+    description = "reindex from [{0}] to [{1}]".format(source, dest)
+    response = dict(client.tasks.list(actions='*reindex', detailed=True))
+    for node in response.get('nodes', {}).values():
+        for task_id, task in node.get('tasks', {}).items():
+            if 'parent_task_id' in task:
+                continue
+            if task.get('description', '').startswith(description):
+                return task_id
+    return None
+
+
+def parse_hhmm(value):
+    '''
+    Convert a HH:MM string into minutes since midnight
+    '''
+    hours, minutes = value.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def scheduled_throttle(module, now):
+    '''
+    Return the throttle that should apply at the given time
+    '''
+    current = now.hour * 60 + now.minute
+    for window in module.params['schedule']:
+        start = parse_hhmm(window['start'])
+        end = parse_hhmm(window['end'])
+        if start <= end:
+            in_window = start <= current < end
+        else:  # window spans midnight
+            in_window = current >= start or current < end
+        if in_window:
+            return window['requests_per_second']
+    return module.params['requests_per_second']
+
+
+def normalise_throttle(value):
+    '''
+    Elastic reports an unthrottled task as -1 or inf
+    '''
+    if value is None:
+        return None
+    value = float(value)
+    if value < 0 or value == float('inf'):
+        return -1.0
+    return value
+
+
+def rethrottle(module, client, task_id, current, desired, changes):
+    '''
+    Rethrottle the task if the desired value differs from the current one
+    '''
+    desired = normalise_throttle(desired)
+    if desired is None or desired == normalise_throttle(current):
+        return current
+    if not module.check_mode:
+        client.reindex_rethrottle(task_id=task_id, requests_per_second=desired)
+    changes.append({
+        "time": datetime.now().isoformat(),
+        "old_value": normalise_throttle(current),
+        "new_value": desired
+    })
+    return desired
+
+
+# ================
+# Module execution
+#
+
+
+def main():
+
+    argument_spec = elastic_common_argument_spec()
+    argument_spec.update(
+        task_id=dict(type='str'),
+        source=dict(type='str'),
+        dest=dict(type='str'),
+        requests_per_second=dict(type='float'),
+        schedule=dict(type='list', elements='dict', options=dict(
+            start=dict(type='str', required=True),
+            end=dict(type='str', required=True),
+            requests_per_second=dict(type='float', required=True),
+        )),
+        deadline=dict(type='int', default=86400),
+        interval=dict(type='int', default=60),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_together=[
+            ['login_user', 'login_password'],
+            ['source', 'dest'],
+        ],
+        required_one_of=[
+            ['task_id', 'source'],
+            ['requests_per_second', 'schedule'],
+        ],
+        mutually_exclusive=[
+            ['task_id', 'source'],
+        ],
+    )
+
+    if not elastic_found:
+        module.fail_json(msg=missing_required_lib('elasticsearch'),
+                         exception=E_IMP_ERR)
+
+    task_id = module.params['task_id']
+    schedule = module.params['schedule']
+    deadline = module.params['deadline']
+    interval = module.params['interval']
+
+    if schedule is not None:
+        for window in schedule:
+            try:
+                parse_hhmm(window['start'])
+                parse_hhmm(window['end'])
+            except ValueError:
+                module.fail_json(msg="Invalid schedule window, start and end must be in HH:MM format: {0}".format(str(window)))
+
+    try:
+        elastic = ElasticHelpers(module)
+        client = elastic.connect()
+
+        if task_id is None:
+            task_id = find_reindex_task(client, module.params['source'], module.params['dest'])
+            if task_id is None:
+                module.fail_json(msg="No running reindex task found from {0} to {1}.".format(module.params['source'],
+                                                                                             module.params['dest']))
+
+        changes = []
+        task = elastic.get_task(client, task_id)
+        current = task.get('task', {}).get('status', {}).get('requests_per_second')
+        completed = task.get('completed', False)
+
+        if schedule is None:
+            if not completed:
+                current = rethrottle(module, client, task_id, current, module.params['requests_per_second'], changes)
+        else:
+            started = time.time()
+            while not completed:
+                current = rethrottle(module, client, task_id, current, scheduled_throttle(module, datetime.now()), changes)
+                if module.check_mode or time.time() - started + interval > deadline:
+                    break
+                time.sleep(interval)
+                task = elastic.get_task(client, task_id)
+                completed = task.get('completed', False)
+
+        if completed and not changes:
+            msg = "The reindex task {0} has already completed.".format(task_id)
+        elif changes:
+            msg = "The reindex task {0} was rethrottled {1} time(s).".format(task_id, len(changes))
+        else:
+            msg = "The reindex task {0} is already throttled as specified.".format(task_id)
+        module.exit_json(changed=len(changes) > 0,
+                         msg=msg,
+                         task=task_id,
+                         requests_per_second=normalise_throttle(current),
+                         completed=completed,
+                         throttle_changes=changes)
+    except Exception as excep:
+        module.fail_json(msg='Elastic error: %s' % to_native(excep))
+
+
+if __name__ == '__main__':
+    main()
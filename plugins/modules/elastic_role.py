@@ -64,8 +64,68 @@ options:
   name:
     description:
       - The name of the role
+      - Mutually exclusive with I(roles).
     type: str
-    required: True
+  roles:
+    description:
+      - A list of roles to manage in a single task.
+      - All roles are fetched with one request and compared locally. Only the roles that
+        need to be created, updated or deleted are written.
+      - Writes use the bulk role apis, in batches of I(batch_size), when both the client
+        and cluster are version 8.15 or later. Otherwise one request is sent per role.
+      - Mutually exclusive with I(name).
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - The name of the role.
+        type: str
+        required: true
+      applications:
+        description:
+          - A list of application privilege entries.
+        type: list
+        elements: dict
+      cluster:
+        description:
+          - A list of cluster privileges.
+        type: list
+        elements: str
+      indices:
+        description:
+          - A list of indices permissions entries.
+        type: list
+        elements: dict
+      metadata:
+        description:
+          - Arbitrary metadata that you want to associate with the role.
+        type: dict
+      run_as:
+        description:
+          - A list of users that the owners of this role can impersonate.
+        type: list
+        elements: str
+      state:
+        description:
+          - The desired state of the role.
+        type: str
+        choices:
+          - present
+          - absent
+        default: present
+  purge:
+    description:
+      - Only used with I(roles).
+      - Delete the roles that are not in I(roles). Reserved roles are never deleted.
+    type: bool
+    default: false
+  batch_size:
+    description:
+      - Only used with I(roles).
+      - The maximum number of roles written or deleted by a single bulk request.
+    type: int
+    default: 100
 
 '''
 
@@ -97,9 +157,38 @@ EXAMPLES = r'''
       - reporting_user
     metadata:
       comment: "System admin role"
+
+- name: Manage the complete set of custom roles, deleting any others
+  community.elastic.elastic_role:
+    purge: true
+    roles:
+      - name: logs_reader
+        indices:
+          - names:
+              - "logs-*"
+            privileges:
+              - read
+      - name: monitor
+        cluster:
+          - monitor
 '''
 
 RETURN = r'''
+created:
+  description: The names of the roles created.
+  returned: when roles is supplied
+  type: list
+  elements: str
+updated:
+  description: The names of the roles updated.
+  returned: when roles is supplied
+  type: list
+  elements: str
+deleted:
+  description: The names of the roles deleted.
+  returned: when roles is supplied
+  type: list
+  elements: str
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -113,7 +202,8 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    NotFoundError,
+    __version__
 )
 
 
@@ -130,9 +220,16 @@ def get_role(module, client, name):
     return response
 
 
-def put_role(module, client, name):
+def get_all_roles(client):
     '''
-    Creates or updates a role
+    Uses the get roles api to return all roles in a single request
+    '''
+    return dict(client.security.get_role())
+
+
+def role_body(params):
+    '''
+    Build the role document from the role options
     '''
     keys = [
         "cluster",
@@ -143,8 +240,16 @@ def put_role(module, client, name):
     ]
     body = {}
     for k in keys:
-        if module.params[k] is not None:
-            body[k] = module.params[k]
+        if params.get(k) is not None:
+            body[k] = params[k]
+    return body
+
+
+def put_role(module, client, name):
+    '''
+    Creates or updates a role
+    '''
+    body = role_body(module.params)
     try:
         response = dict(client.security.put_role(name=name, body=body))
         if not isinstance(response, dict):  # Valid response should be a dict
@@ -154,22 +259,24 @@ def put_role(module, client, name):
     return response
 
 
-def role_is_different(current_role, module):
+def role_is_different(current_role, module, params=None):
     '''
     Simplified version of original function to check if role is different
     '''
+    if params is None:
+        params = module.params
     role = {
-        module.params['name']: {
-            "cluster": module.params['cluster'] or [],
-            "indices": module.params['indices'] or [],
-            "applications": module.params['applications'] or [],
-            "run_as": module.params['run_as'] or [],
-            "metadata": module.params['metadata'] or {}
+        params['name']: {
+            "cluster": params.get('cluster') or [],
+            "indices": params.get('indices') or [],
+            "applications": params.get('applications') or [],
+            "run_as": params.get('run_as') or [],
+            "metadata": params.get('metadata') or {}
         }
     }
     # Get rid of these default values
-    current_role[module.params['name']].pop('transient_metadata', None)
-    for index in current_role[module.params['name']]['indices']:
+    current_role[params['name']].pop('transient_metadata', None)
+    for index in current_role[params['name']]['indices']:
         index.pop('allow_restricted_indices', None)
     dict1 = json.dumps(current_role, sort_keys=True)
     dict2 = json.dumps(role, sort_keys=True)
@@ -205,6 +312,82 @@ def _role_is_different(current_role, module):
         return True
 
 
+def bulk_roles_supported(client):
+    '''
+    The bulk role apis need client and cluster version 8.15 or later
+    '''
+    if __version__ < (8, 15, 0):
+        return False
+    version = dict(client.info())['version']['number']
+    return tuple(int(v) for v in version.split('-')[0].split('.')[:2]) >= (8, 15)
+
+
+def bulk_errors(module, response):
+    '''
+    Fail if a bulk role request reports errors
+    '''
+    errors = response.get('errors', {})
+    if errors.get('count', 0) > 0:
+        module.fail_json(msg="Errors reported by the bulk role api: {0}".format(str(errors.get('details'))))
+
+
+def write_roles(module, client, roles, deleted):
+    '''
+    Put the roles and delete the deleted role names, using batched bulk
+    requests when supported
+    '''
+    batch_size = module.params['batch_size']
+    if bulk_roles_supported(client):
+        names = list(roles.keys())
+        for i in range(0, len(names), batch_size):
+            batch = dict((name, roles[name]) for name in names[i:i + batch_size])
+            bulk_errors(module, dict(client.security.bulk_put_role(roles=batch)))
+        for i in range(0, len(deleted), batch_size):
+            bulk_errors(module, dict(client.security.bulk_delete_role(names=deleted[i:i + batch_size])))
+    else:
+        for name, body in roles.items():
+            client.security.put_role(name=name, body=body)
+        for name in deleted:
+            client.security.delete_role(name=name)
+
+
+def manage_roles(module, client):
+    '''
+    Fetch all roles once, compare locally and only write the roles that differ
+    '''
+    current_roles = get_all_roles(client)
+    created = []
+    updated = []
+    deleted = []
+    to_write = {}
+    desired = set()
+    for role in module.params['roles']:
+        name = role['name']
+        desired.add(name)
+        current_role = current_roles.get(name)
+        if role['state'] == "absent":
+            if current_role is not None:
+                deleted.append(name)
+        elif current_role is None:
+            to_write[name] = role_body(role)
+            created.append(name)
+        elif role_is_different({name: current_role}, module, role):
+            to_write[name] = role_body(role)
+            updated.append(name)
+    if module.params['purge']:
+        for name in sorted(current_roles):
+            if name not in desired and not current_roles[name].get('metadata', {}).get('_reserved', False):
+                deleted.append(name)
+    if not module.check_mode and (to_write or deleted):
+        write_roles(module, client, to_write, deleted)
+    changed = len(created + updated + deleted) > 0
+    module.exit_json(changed=changed,
+                     msg="{0} role(s) created, {1} updated and {2} deleted.".format(len(created), len(updated), len(deleted)),
+                     created=created,
+                     updated=updated,
+                     deleted=deleted)
+
+
 # ================
 # Module execution
 #
@@ -223,7 +406,18 @@ def main():
         global_v=dict(type='dict'),
         indices=dict(type='list', elements='dict'),
         metadata=dict(type='dict'),
-        name=dict(type='str', required=True),
+        name=dict(type='str'),
+        roles=dict(type='list', elements='dict', options=dict(
+            name=dict(type='str', required=True),
+            applications=dict(type='list', elements='dict'),
+            cluster=dict(type='list', elements='str'),
+            indices=dict(type='list', elements='dict'),
+            metadata=dict(type='dict'),
+            run_as=dict(type='list', elements='str'),
+            state=dict(type='str', choices=state_choices, default='present'),
+        )),
+        purge=dict(type='bool', default=False),
+        batch_size=dict(type='int', default=100),
         run_as=dict(type='list', elements='str'),
         state=dict(type='str', choices=state_choices, default='present'),
     )
@@ -232,6 +426,8 @@ def main():
         argument_spec=argument_spec,
         supports_check_mode=True,
         required_together=[['login_user', 'login_password']],
+        required_one_of=[['name', 'roles']],
+        mutually_exclusive=[['name', 'roles']],
     )
 
     if not elastic_found:
@@ -241,10 +437,16 @@ def main():
     name = module.params['name']
     state = module.params['state']
 
+    if module.params['batch_size'] < 1:
+        module.fail_json(msg="batch_size must be at least 1.")
+
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
+        if module.params['roles'] is not None:
+            manage_roles(module, client)
+
         role = get_role(module, client, name)
         response = None
 
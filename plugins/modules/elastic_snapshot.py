@@ -16,6 +16,9 @@ short_description: Manage Elasticsearch Snapshots.
 description:
   - Manage Elasticsearch Snapshots.
   - Create, delete and restore snapshots.
+  - Snapshot creation can be followed until it completes with I(wait).
+  - Restores can rename indexes and override index settings, e.g. restoring without replicas
+    and adding them once the primaries are active with I(restore_replicas).
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -50,6 +53,7 @@ options:
       - present
       - absent
       - restore
+      - pruned
     default: present
   metadata:
     description:
@@ -58,13 +62,87 @@ options:
   name:
     description:
       - The name of the snapshot.
+      - With I(state=pruned) a wildcard pattern of the snapshot names retention applies to. Defaults to all snapshots.
+      - Required unless I(state=pruned).
     type: str
-    required: yes
   partial:
     description:
       - If false, the entire snapshot will fail if one or more indices included in the snapshot do not have all primary shards available.
     type: bool
     default: False
+  rename_pattern:
+    description:
+      - Only used with I(state=restore).
+      - A regular expression applied to the names of the indexes being restored.
+    type: str
+  rename_replacement:
+    description:
+      - Only used with I(state=restore).
+      - The replacement for I(rename_pattern). Groups are referenced with $1, $2 etc.
+    type: str
+  index_settings:
+    description:
+      - Only used with I(state=restore).
+      - Settings that override those of the restored indexes e.g. C(index.number_of_replicas: 0).
+    type: dict
+  ignore_index_settings:
+    description:
+      - Only used with I(state=restore).
+      - Settings of the snapshotted indexes that are not restored.
+    type: list
+    elements: str
+  restore_replicas:
+    description:
+      - Only used with I(state=restore).
+      - Once the primary shards of the restored indexes are active set their number of replicas to this value.
+      - The restore request then waits for the restore to complete, for at most I(deadline) seconds,
+        so the names of the restored indexes can be taken from its response.
+      - Combine with I(index_settings) of C(index.number_of_replicas: 0) so the primaries are restored first.
+      - Waiting for the primaries uses I(deadline), I(interval) and I(max_interval).
+    type: int
+  wait:
+    description:
+      - Wait for a new snapshot to complete by polling the snapshot status api.
+      - The interval between polls starts at I(interval) and doubles up to I(max_interval).
+      - The module fails if the snapshot fails or has not completed within I(deadline) seconds.
+        The snapshot itself keeps running.
+    type: bool
+    default: False
+  deadline:
+    description:
+      - Maximum number of seconds to wait for the snapshot to complete when I(wait=true),
+        or for the primaries of the restored indexes to be active with I(restore_replicas).
+    type: int
+    default: 3600
+  interval:
+    description:
+      - The initial number of seconds to sleep between polls when I(wait=true) or I(restore_replicas) is used.
+    type: int
+    default: 5
+  max_interval:
+    description:
+      - The maximum number of seconds to sleep between polls when I(wait=true) or I(restore_replicas) is used.
+    type: int
+    default: 60
+  keep_last:
+    description:
+      - Only used with I(state=pruned).
+      - The number of most recent snapshots matching I(name) to keep.
+      - Combined with I(max_age) snapshots beyond the last I(keep_last) are only deleted when older than I(max_age).
+    type: int
+  max_age:
+    description:
+      - Only used with I(state=pruned).
+      - Delete snapshots matching I(name) that started longer ago than this.
+      - An Elasticsearch time value e.g. C(30d) or C(12h).
+    type: str
+  batch_size:
+    description:
+      - Only used with I(state=pruned).
+      - The maximum number of snapshots deleted by a single request.
+      - Multi-snapshot deletes require Elasticsearch 7.8 or later, set to 1 for older clusters.
+    type: int
+    default: 50
 
 '''
 
@@ -92,14 +170,66 @@ EXAMPLES = r'''
     location: "/mnt/my_backup_location"
     state: "present"
 
+- name: Create a snapshot and wait up to two hours for it to complete
+  community.elastic.elastic_snapshot:
+    name: "my_snapshot"
+    repository: "my_repository"
+    wait: yes
+    deadline: 7200
+
 - name: Restore a snpashot
   community.elastic.elastic_repository:
     name: "my_snapshot"
     repository: "my_repository"
     state: "restore"
+
+- name: Restore an index alongside the live one without replicas, adding one replica once the primaries are active
+  community.elastic.elastic_snapshot:
+    name: "my_snapshot"
+    repository: "my_repository"
+    indices:
+      - "myindex1"
+    rename_pattern: "(.+)"
+    rename_replacement: "restored-$1"
+    index_settings:
+      index.number_of_replicas: 0
+    ignore_index_settings:
+      - index.refresh_interval
+    restore_replicas: 1
+    state: "restore"
+
+- name: Keep the last 14 nightly snapshots and anything newer than 30 days
+  community.elastic.elastic_snapshot:
+    name: "nightly-*"
+    repository: "my_repository"
+    keep_last: 14
+    max_age: 30d
+    state: "pruned"
 '''
 
 RETURN = r'''
+progress:
+  description:
+    - Progress of the snapshot when I(wait=true).
+    - Contains state, files_done, files_total, bytes_done, bytes_total, percent,
+      elapsed_seconds, bytes_per_sec and eta_seconds.
+    - Totals only count the files that are not already in the repository.
+  returned: when wait is true and a snapshot was created
+  type: dict
+restored_indices:
+  description: The names of the restored indexes whose replicas were set.
+  returned: when restore_replicas is supplied
+  type: list
+  elements: str
+deleted:
+  description: The names of the snapshots deleted, or that would be deleted in check mode.
+  returned: when state is pruned
+  type: list
+  elements: str
+kept:
+  description: The number of snapshots matching I(name) that were kept.
+  returned: when state is pruned
+  type: int
 '''
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
@@ -111,8 +241,11 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    NotFoundError,
+    time_value_to_nanos,
+    __version__
 )
+import time
 
 
 def get_snapshot(module, client, repository, name):
@@ -151,6 +284,72 @@ def create_snapshot(module, client, repository, name):
     return response
 
 
+def get_snapshot_status(client, repository, name):
+    '''
+    Uses the snapshot status api to return the status of the given snapshot
+    '''
+    response = dict(client.snapshot.status(repository=repository, snapshot=name))
+    return response['snapshots'][0]
+
+
+def snapshot_progress(status):
+    '''
+    Summarise the snapshot status. Only files not already present in the
+    repository (the incremental stats) need to be copied.
+    '''
+    stats = status.get('stats', {})
+    total = stats.get('incremental', {})
+    processed = stats.get('processed', {})
+    bytes_total = total.get('size_in_bytes', 0)
+    bytes_done = processed.get('size_in_bytes', 0)
+    if status['state'] == 'SUCCESS':
+        bytes_done = bytes_total
+    elapsed = stats.get('time_in_millis', 0) / 1000.0
+    bytes_per_sec = 0
+    eta_seconds = None
+    if elapsed > 0:
+        bytes_per_sec = int(bytes_done / elapsed)
+    if status['state'] == 'SUCCESS':
+        eta_seconds = 0
+    elif bytes_per_sec > 0:
+        eta_seconds = int((bytes_total - bytes_done) / bytes_per_sec)
+    percent = 100.0
+    if bytes_total > 0:
+        percent = round(bytes_done * 100.0 / bytes_total, 2)
+    return {
+        "state": status['state'],
+        "files_done": processed.get('file_count', 0),
+        "files_total": total.get('file_count', 0),
+        "bytes_done": bytes_done,
+        "bytes_total": bytes_total,
+        "percent": percent,
+        "elapsed_seconds": round(elapsed, 2),
+        "bytes_per_sec": bytes_per_sec,
+        "eta_seconds": eta_seconds,
+    }
+
+
+def wait_for_snapshot(module, client, repository, name):
+    '''
+    Poll the snapshot status with backoff until it completes or the deadline is reached
+    '''
+    done_states = ['SUCCESS']
+    if module.params['partial']:
+        done_states.append('PARTIAL')
+    started = time.time()
+    interval = module.params['interval']
+    while True:
+        progress = snapshot_progress(get_snapshot_status(client, repository, name))
+        if progress['state'] in done_states:
+            return progress
+        if progress['state'] in ['FAILED', 'PARTIAL', 'ABORTED']:
+            module.fail_json(msg="The snapshot {0} did not complete successfully.".format(name), progress=progress)
+        if time.time() - started + interval > module.params['deadline']:
+            module.fail_json(msg="Timed out waiting for the snapshot {0} to complete.".format(name), progress=progress)
+        time.sleep(interval)
+        interval = min(interval * 2, module.params['max_interval'])
+
+
 def restore_snapshot(module, client, repository, name):
     '''
     Restore an elastic snapshot
@@ -161,19 +360,113 @@ def restore_snapshot(module, client, repository, name):
     }
     if module.params['indices'] is not None:
         body['indices'] = module.params['indices']
+    for key in ['rename_pattern', 'rename_replacement', 'index_settings', 'ignore_index_settings']:
+        if module.params[key] is not None:
+            body[key] = module.params[key]
+    restore_arg = dict(repository=repository, snapshot=name, body=body)
+    restore_client = client
+    if module.params['restore_replicas'] is not None:
+        # The response of a completed restore lists the restored indexes
+        restore_arg['wait_for_completion'] = True
+        if __version__ >= (8, 0, 0):
+            restore_client = client.options(request_timeout=module.params['deadline'])
+        else:
+            restore_arg['request_timeout'] = module.params['deadline']
     try:
-        response = dict(client.snapshot.restore(repository=repository,
-                                                snapshot=name,
-                                                body=body))
+        response = dict(restore_client.snapshot.restore(**restore_arg))
         if not isinstance(response, dict):  # Valid response should be a dict
             module.fail_json(msg="Invalid response received: {0}.".format(str(response)))
-        if response['snapshot']['shards']['failed'] > 0:
+        if 'snapshot' in response and response['snapshot']['shards']['failed'] > 0:
             module.fail_json(msg="The restore process encountered failures: {0}".format(str(response)))
     except Exception as excep:
         module.fail_json(msg=str(excep))
     return response
 
 
+def restored_index_names(response):
+    '''
+    The names of the indexes created by a completed restore, after any rename
+    '''
+    return sorted(response.get('snapshot', {}).get('indices', []))
+
+
+def set_restore_replicas(module, elastic, client, names):
+    '''
+    Wait with backoff for the primaries of the restored indexes to be active,
+    then set their number of replicas
+    '''
+    started = time.time()
+    interval = module.params['interval']
+    batches = elastic.batch_index_names(names)
+    while True:
+        statuses = [dict(client.cluster.health(index=batch))['status'] for batch in batches]
+        if 'red' not in statuses:
+            break
+        if time.time() - started + interval > module.params['deadline']:
+            module.fail_json(msg="Timed out waiting for the primaries of the restored indexes to be active.",
+                             restored_indices=names)
+        time.sleep(interval)
+        interval = min(interval * 2, module.params['max_interval'])
+    for batch in batches:
+        client.indices.put_settings(index=batch, body={"index.number_of_replicas": module.params['restore_replicas']})
+
+
+def list_snapshots(client, repository, pattern):
+    '''
+    List the snapshots in the repository matching the pattern with a single request
+    '''
+    try:
+        response = dict(client.snapshot.get(repository=repository,
+                                            snapshot=pattern,
+                                            ignore_unavailable=True))
+    except NotFoundError:
+        return []
+    return response.get('snapshots', [])
+
+
+def expired_snapshots(module, snapshots, now):
+    '''
+    Return the names of the snapshots to delete, oldest first.
+    Running snapshots are never deleted.
+    '''
+    keep_last = module.params['keep_last']
+    max_age = module.params['max_age']
+    snapshots = [s for s in snapshots if s.get('state') != 'IN_PROGRESS']
+    snapshots = sorted(snapshots, key=lambda s: s.get('start_time_in_millis', 0), reverse=True)
+    if keep_last is not None:
+        snapshots = snapshots[keep_last:]
+    if max_age is not None:
+        cutoff = (now - time_value_to_nanos(max_age) / 1000.0 ** 3) * 1000
+        snapshots = [s for s in snapshots if s.get('start_time_in_millis', 0) < cutoff]
+    return [s['snapshot'] for s in reversed(snapshots)]
+
+
+def delete_snapshots(client, repository, names, batch_size):
+    '''
+    Delete the snapshots in comma-joined batches, each batch is a single
+    rewrite of the repository metadata
+    '''
+    for i in range(0, len(names), batch_size):
+        client.snapshot.delete(repository=repository, snapshot=",".join(names[i:i + batch_size]))
+
+
+def prune_snapshots(module, client, repository):
+    '''
+    Apply the retention rules to the repository
+    '''
+    pattern = module.params['name'] or '*'
+    snapshots = list_snapshots(client, repository, pattern)
+    deleted = expired_snapshots(module, snapshots, time.time())
+    if deleted and not module.check_mode:
+        delete_snapshots(client, repository, deleted, module.params['batch_size'])
+    kept = len(snapshots) - len(deleted)
+    if deleted:
+        msg = "Deleted {0} snapshot(s) from the repository {1}.".format(len(deleted), repository)
+    else:
+        msg = "No snapshots in the repository {0} have expired.".format(repository)
+    module.exit_json(changed=len(deleted) > 0, msg=msg, deleted=deleted, kept=kept)
+
+
 # ================
 # Module execution
 #
@@ -183,7 +476,8 @@ def main():
     state_choices = [
         "present",
         "absent",
-        "restore"
+        "restore",
+        "pruned"
     ]
 
     argument_spec = elastic_common_argument_spec()
@@ -193,14 +487,35 @@ def main():
         repository=dict(type='str', required=True),
         state=dict(type='str', choices=state_choices, default='present'),
         metadata=dict(type='str'),
-        name=dict(type='str', required=True),
-        partial=dict(type='bool', default=False)
+        name=dict(type='str'),
+        partial=dict(type='bool', default=False),
+        wait=dict(type='bool', default=False),
+        deadline=dict(type='int', default=3600),
+        interval=dict(type='int', default=5),
+        max_interval=dict(type='int', default=60),
+        rename_pattern=dict(type='str'),
+        rename_replacement=dict(type='str'),
+        index_settings=dict(type='dict'),
+        ignore_index_settings=dict(type='list', elements='str'),
+        restore_replicas=dict(type='int'),
+        keep_last=dict(type='int'),
+        max_age=dict(type='str'),
+        batch_size=dict(type='int', default=50),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
-        required_together=[['login_user', 'login_password']],
+        required_together=[
+            ['login_user', 'login_password'],
+            ['rename_pattern', 'rename_replacement'],
+        ],
+        required_if=[
+            ['state', 'present', ['name']],
+            ['state', 'absent', ['name']],
+            ['state', 'restore', ['name']],
+            ['state', 'pruned', ['keep_last', 'max_age'], True],
+        ],
     )
 
     if not elastic_found:
@@ -211,10 +526,23 @@ def main():
     repository = module.params['repository']
     state = module.params['state']
 
+    if state == "pruned":
+        if module.params['keep_last'] is not None and module.params['keep_last'] < 0:
+            module.fail_json(msg="keep_last must not be negative.")
+        if module.params['batch_size'] < 1:
+            module.fail_json(msg="batch_size must be at least 1.")
+        if module.params['max_age'] is not None:
+            max_age_nanos = time_value_to_nanos(module.params['max_age'])
+            if max_age_nanos is None or max_age_nanos < 0:
+                module.fail_json(msg="Invalid age: {0}".format(module.params['max_age']))
+
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
+        if state == "pruned":
+            prune_snapshots(module, client, repository)
+
         snapshot = get_snapshot(module, client, repository, name)
         response = None
 
@@ -222,6 +550,11 @@ def main():
             if state == "present":
                 if module.check_mode is False:
                     response = create_snapshot(module, client, repository, name)
+                    if module.params['wait']:
+                        progress = wait_for_snapshot(module, client, repository, name)
+                        module.exit_json(changed=True,
+                                         msg="The snapshot {0} was successfully created: {1}".format(name, str(response)),
+                                         progress=progress)
                 else:
                     response = {"acknowledged": True}
                 module.exit_json(changed=True, msg="The snapshot {0} was successfully created: {1}".format(name, str(response)))
@@ -241,6 +574,13 @@ def main():
             elif state == "restore":
                 if module.check_mode is False:
                     response = restore_snapshot(module, client, repository, name)
+                    if module.params['restore_replicas'] is not None:
+                        restored = restored_index_names(response)
+                        if restored:
+                            set_restore_replicas(module, elastic, client, restored)
+                        module.exit_json(changed=True,
+                                         msg="The snapshot {0} was restored: {1}".format(name, str(response)),
+                                         restored_indices=restored)
                 else:
                     response = {"acknowledged": True}
                 module.exit_json(changed=True, msg="The snapshot {0} was restored: {1}".format(name, str(response)))
@@ -0,0 +1,314 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Rhys Campbell (@rhysmeister) <rhyscampbell@bluewin.ch>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: elastic_snapshot_lifecycle
+
+short_description: Manage Elasticsearch Snapshot Lifecycle Policies.
+
+description:
+  - Manage Elasticsearch Snapshot Lifecycle Management (SLM) Policies.
+  - Create, update and delete SLM Policies and optionally execute them on demand.
+
+author: Rhys Campbell (@rhysmeister)
+version_added: "1.5.0"
+
+extends_documentation_fragment:
+  - community.elastic.login_options
+
+options:
+  state:
+    description: The state of the SLM Policy.
+    type: str
+    choices:
+      - present
+      - absent
+    default: present
+  name:
+    description:
+      - The SLM Policy id.
+    type: str
+    required: True
+  snapshot_name:
+    description:
+      - The name given to the snapshots taken by the policy.
+      - Supports date math e.g. C(<nightly-{now/d}>).
+      - Required when I(state=present).
+    type: str
+  schedule:
+    description:
+      - The cron schedule of the policy e.g. C(0 30 1 * * ?).
+      - Required when I(state=present).
+    type: str
+  repository:
+    description:
+      - The repository the snapshots are stored in.
+      - Required when I(state=present).
+    type: str
+  indices:
+    description:
+      - The data streams and indexes to include in the snapshots.
+      - By default all data streams and indexes are included.
+    type: list
+    elements: str
+  config:
+    description:
+      - Other snapshot configuration e.g. ignore_unavailable, include_global_state or partial.
+      - I(indices) takes precedence over C(indices) in this dictionary.
+    type: dict
+  retention:
+    description:
+      - The retention rules of the policy.
+    type: dict
+    suboptions:
+      expire_after:
+        description:
+          - Time period after which a snapshot is considered expired e.g. C(30d).
+        type: str
+      min_count:
+        description:
+          - Minimum number of snapshots to retain, even if they are expired.
+        type: int
+      max_count:
+        description:
+          - Maximum number of snapshots to retain, even if they are not expired.
+        type: int
+  execute:
+    description:
+      - Take a snapshot with the policy immediately once it is configured.
+      - The snapshot is taken even if the policy was not changed.
+    type: bool
+    default: false
+'''
+
+EXAMPLES = r'''
+- name: Take a snapshot of all indexes every night and keep them for 30 days
+  community.elastic.elastic_snapshot_lifecycle:
+    name: nightly
+    snapshot_name: "<nightly-{now/d}>"
+    schedule: "0 30 1 * * ?"
+    repository: my_repository
+    config:
+      include_global_state: false
+    retention:
+      expire_after: 30d
+      min_count: 5
+      max_count: 50
+
+- name: Create a policy and take a snapshot with it now
+  community.elastic.elastic_snapshot_lifecycle:
+    name: hourly-logs
+    snapshot_name: "<logs-{now/H{yyyy.MM.dd.HH}}>"
+    schedule: "0 0 * * * ?"
+    repository: my_repository
+    indices:
+      - "logs-*"
+    execute: yes
+
+- name: Delete an SLM Policy
+  community.elastic.elastic_snapshot_lifecycle:
+    name: nightly
+    state: absent
+'''
+
+RETURN = r'''
+msg:
+  description: A short message describing what happened.
+  returned: always
+  type: str
+differences:
+  description: The policy fields that differ, each with the current and desired value.
+  returned: when an existing policy was updated
+  type: dict
+snapshot_name:
+  description: The name of the snapshot taken when I(execute=true).
+  returned: when execute is true and not in check mode
+  type: str
+'''
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+
+
+from ansible_collections.community.elastic.plugins.module_utils.elastic_common import (
+    missing_required_lib,
+    elastic_found,
+    E_IMP_ERR,
+    elastic_common_argument_spec,
+    ElasticHelpers,
+    NotFoundError
+)
+import json
+
+
+def get_policy(client, name):
+    '''
+    Gets the SLM policy specified by name
+    '''
+    try:
+        policy_doc = dict(client.slm.get_lifecycle(policy_id=name))[name]['policy']
+    except NotFoundError:
+        policy_doc = None
+    return policy_doc
+
+
+def build_policy(module):
+    '''
+    Build the policy document from the module parameters
+    '''
+    policy = {
+        "name": module.params['snapshot_name'],
+        "schedule": module.params['schedule'],
+        "repository": module.params['repository'],
+    }
+    config = dict(module.params['config'] or {})
+    if module.params['indices'] is not None:
+        config['indices'] = module.params['indices']
+    if config:
+        policy['config'] = config
+    if module.params['retention'] is not None:
+        retention = dict((k, v) for k, v in module.params['retention'].items() if v is not None)
+        if retention:
+            policy['retention'] = retention
+    return policy
+
+
+def normalise_policy(policy):
+    '''
+    Normalise a policy document so equivalent policies compare equal.
+    Empty sections are dropped and a comma separated indices string becomes a list.
+    '''
+    normalised = {}
+    for key in ['name', 'schedule', 'repository']:
+        if policy.get(key) is not None:
+            normalised[key] = policy[key]
+    config = dict(policy.get('config') or {})
+    if isinstance(config.get('indices'), str):
+        config['indices'] = [i.strip() for i in config['indices'].split(',')]
+    if config:
+        normalised['config'] = config
+    retention = policy.get('retention') or {}
+    if retention:
+        normalised['retention'] = retention
+    return normalised
+
+
+def policy_differences(current_policy, desired_policy):
+    '''
+    Return the top level fields of the policy that differ
+    '''
+    current = normalise_policy(current_policy)
+    desired = normalise_policy(desired_policy)
+    differences = {}
+    for key in sorted(set(current) | set(desired)):
+        if json.dumps(current.get(key), sort_keys=True) != json.dumps(desired.get(key), sort_keys=True):
+            differences[key] = {"current": current.get(key), "desired": desired.get(key)}
+    return differences
+
+
+def execute_policy(module, client, name):
+    '''
+    Take a snapshot with the policy now, returning the snapshot name
+    '''
+    if module.check_mode:
+        return None
+    response = dict(client.slm.execute_lifecycle(policy_id=name))
+    return response.get('snapshot_name')
+
+# ================
+# Module execution
+#
+
+
+def main():
+
+    state_choices = [
+        "present",
+        "absent",
+    ]
+
+    argument_spec = elastic_common_argument_spec()
+    argument_spec.update(
+        name=dict(type='str', required=True),
+        state=dict(type='str', choices=state_choices, default='present'),
+        snapshot_name=dict(type='str'),
+        schedule=dict(type='str'),
+        repository=dict(type='str'),
+        indices=dict(type='list', elements='str'),
+        config=dict(type='dict'),
+        retention=dict(type='dict', options=dict(
+            expire_after=dict(type='str'),
+            min_count=dict(type='int'),
+            max_count=dict(type='int'),
+        )),
+        execute=dict(type='bool', default=False),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_together=[['login_user', 'login_password']],
+        required_if=[
+            ['state', 'present', ['snapshot_name', 'schedule', 'repository']],
+        ],
+    )
+
+    if not elastic_found:
+        module.fail_json(msg=missing_required_lib('elasticsearch'),
+                         exception=E_IMP_ERR)
+
+    name = module.params['name']
+    state = module.params['state']
+
+    try:
+        elastic = ElasticHelpers(module)
+        client = elastic.connect()
+
+        current_policy = get_policy(client, name)
+
+        if state == 'present':
+            policy = build_policy(module)
+            result = {}
+            if current_policy is not None:
+                differences = policy_differences(current_policy, policy)
+                changed = len(differences) > 0
+                if changed:
+                    result['differences'] = differences
+                    msg = "The SLM Policy '{0}' was updated.".format(name)
+                else:
+                    msg = "The SLM Policy '{0}' is configured as specified.".format(name)
+            else:
+                changed = True
+                msg = "The SLM Policy '{0}' was created.".format(name)
+            if changed and not module.check_mode:
+                client.slm.put_lifecycle(policy_id=name, body=policy)
+            if module.params['execute']:
+                snapshot_name = execute_policy(module, client, name)
+                if snapshot_name is not None:
+                    result['snapshot_name'] = snapshot_name
+                changed = True
+                msg += " A snapshot was taken with the policy."
+            module.exit_json(changed=changed, msg=msg, **result)
+        elif state == 'absent':
+            if current_policy is not None:
+                if module.check_mode:
+                    response = {"acknowledged": True}
+                else:
+                    response = dict(client.slm.delete_lifecycle(policy_id=name))
+                module.exit_json(changed=True, msg="The SLM Policy '{0}' was deleted.".format(name), **response)
+            else:
+                module.exit_json(changed=False, msg="The SLM Policy '{0}' does not exist.".format(name))
+    except Exception as excep:
+        module.fail_json(msg='Elastic error: %s' % to_native(excep))
+
+
+if __name__ == '__main__':
+    main()
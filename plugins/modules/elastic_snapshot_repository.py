@@ -15,8 +15,8 @@ short_description: Manage Elasticsearch Snapshot Repositories.
 
 description:
   - Manage Elasticsearch Snapshot Repositories.
-  - Create and delete repostories.
-  - At present no update functionality.
+  - Create, update and delete repostories.
+  - The type and settings of an existing repository are compared with those supplied and the repository updated when they differ.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -54,6 +54,65 @@ options:
       - If false, this verification is skipped
     type: bool
     default: True
+  settings:
+    description:
+      - Other settings of the repository e.g. C(compress) or the C(bucket) of an s3 repository.
+      - Only the settings supplied are compared with those of an existing repository.
+      - When an existing repository of the same type is updated its other settings are kept.
+    type: dict
+  max_snapshot_bytes_per_sec:
+    description:
+      - Maximum snapshot creation rate per node e.g. C(40mb). Set to C(0) to disable throttling.
+      - Byte sizes are compared in bytes so C(1gb) and C(1024mb) are equal.
+    type: str
+  max_restore_bytes_per_sec:
+    description:
+      - Maximum snapshot restore rate per node e.g. C(40mb). Set to C(0) to disable throttling.
+    type: str
+  actions:
+    description:
+      - Only used with I(state=present).
+      - Actions run against the repository once it exists, in the order given.
+      - C(verify) checks the repository is functional on all master and data nodes.
+      - C(cleanup) removes data from the repository that is not referenced by any snapshot.
+      - C(analyze) runs the repository analysis api, writing and reading test blobs
+        bounded by I(analysis), and returns the measured throughput.
+    type: list
+    elements: str
+    choices:
+      - verify
+      - cleanup
+      - analyze
+  analysis:
+    description:
+      - Bounds of the repository analysis run by the C(analyze) action.
+    type: dict
+    suboptions:
+      blob_count:
+        description:
+          - The number of blobs to write.
+        type: int
+        default: 10
+      max_blob_size:
+        description:
+          - The maximum size of a blob e.g. C(10mb).
+        type: str
+        default: 1mb
+      max_total_data_size:
+        description:
+          - The maximum total size of all blobs written.
+        type: str
+        default: 10mb
+      concurrency:
+        description:
+          - The number of write operations to perform concurrently.
+        type: int
+        default: 10
+      timeout:
+        description:
+          - How long to wait for the analysis to complete e.g. C(120s).
+        type: str
+        default: 30s
 
 '''
 
@@ -68,9 +127,58 @@ EXAMPLES = r'''
   community.elastic.elastic_snapshot_repository:
     name: "my_repository"
     state: "absent"
+
+- name: Cap the snapshot and restore rates of a repository
+  community.elastic.elastic_snapshot_repository:
+    name: "my_repository"
+    location: "/mnt/my_backup_location"
+    max_snapshot_bytes_per_sec: 100mb
+    max_restore_bytes_per_sec: 200mb
+
+- name: Verify a repository and remove unreferenced data
+  community.elastic.elastic_snapshot_repository:
+    name: "my_repository"
+    location: "/mnt/my_backup_location"
+    actions:
+      - verify
+      - cleanup
+
+- name: Benchmark a repository with 50 blobs of up to 10mb
+  community.elastic.elastic_snapshot_repository:
+    name: "my_repository"
+    location: "/mnt/my_backup_location"
+    actions:
+      - analyze
+    analysis:
+      blob_count: 50
+      max_blob_size: 10mb
+      max_total_data_size: 500mb
+      timeout: 300s
+  register: benchmark
 '''
 
 RETURN = r'''
+differences:
+  description: The type and settings that differ from those of the existing repository, each with the current and desired value.
+  returned: when an existing repository was updated
+  type: dict
+verified_nodes:
+  description: The names of the nodes that verified the repository.
+  returned: when the verify action is run and not in check mode
+  type: list
+  elements: str
+cleanup:
+  description: The deleted_bytes and deleted_blobs removed by the cleanup action.
+  returned: when the cleanup action is run and not in check mode
+  type: dict
+analysis:
+  description:
+    - Summary of the repository analysis.
+    - Contains blob_count, write_count, write_bytes, write_bytes_per_sec, read_count, read_bytes,
+      read_bytes_per_sec, listing_elapsed_ms, delete_elapsed_ms and issues_detected.
+    - Throughput is the bytes transferred divided by the total time spent in the operations.
+  returned: when the analyze action is run and not in check mode
+  type: dict
 '''
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
@@ -83,6 +191,7 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_common_argument_spec,
     ElasticHelpers,
     NotFoundError,
+    byte_size_to_bytes,
     __version__
 )
 
@@ -101,15 +210,56 @@ def get_snapshot_repository(module, client, name):
     return response
 
 
-def put_repository(module, client, name):
+def repository_settings(module):
+    '''
+    Build the repository settings from the module parameters
+    '''
+    settings = dict(module.params['settings'] or {})
+    for key in ['location', 'max_snapshot_bytes_per_sec', 'max_restore_bytes_per_sec']:
+        if module.params[key] is not None:
+            settings[key] = module.params[key]
+    return settings
+
+
+def normalise_setting(value):
     '''
-    Creates a repository
+    Elastic returns settings as strings. Byte sizes are compared in bytes.
     '''
+    if isinstance(value, bool):
+        return str(value).lower()
+    size = byte_size_to_bytes(value)
+    if size is not None:
+        return size
+    return str(value)
+
+
+def repository_differences(module, repository, name):
+    '''
+    Compare the type and supplied settings with those of the existing repository
+    '''
+    current = repository[name]
+    differences = {}
+    if current.get('type') != module.params['type']:
+        differences['type'] = {"current": current.get('type'), "desired": module.params['type']}
+    current_settings = current.get('settings', {})
+    for key, value in repository_settings(module).items():
+        if key not in current_settings or normalise_setting(current_settings[key]) != normalise_setting(value):
+            differences[key] = {"current": current_settings.get(key), "desired": value}
+    return differences
+
+
+def put_repository(module, client, name, repository=None):
+    '''
+    Creates or updates a repository. The put replaces all the settings, so the
+    supplied settings are merged over those of an existing repository of the same type.
+    '''
+    settings = {}
+    if repository is not None and repository[name].get('type') == module.params['type']:
+        settings.update(repository[name].get('settings', {}))
+    settings.update(repository_settings(module))
     body = {
         "type": module.params['type'],
-        "settings": {
-            "location": module.params['location']
-        }
+        "settings": settings
     }
     try:
         name_arg = {('repository', 'name')[__version__ >= (8, 0, 0)]: name}
@@ -126,6 +276,83 @@ def put_repository(module, client, name):
     return response
 
 
+def repository_arg(name):
+    '''
+    The repository name argument differs between client versions
+    '''
+    return {('repository', 'name')[__version__ >= (8, 0, 0)]: name}
+
+
+def verify_repository(client, name):
+    '''
+    Verify the repository, returning the names of the nodes that verified it
+    '''
+    response = dict(client.snapshot.verify_repository(**repository_arg(name)))
+    return sorted(node['name'] for node in response.get('nodes', {}).values())
+
+
+def cleanup_repository(client, name):
+    '''
+    Remove unreferenced data from the repository
+    '''
+    response = dict(client.snapshot.cleanup_repository(**repository_arg(name)))
+    return response.get('results', {})
+
+
+def bytes_per_sec(size_in_bytes, elapsed_nanos):
+    '''
+    Throughput of an operation, 0 when no time was recorded
+    '''
+    if not elapsed_nanos:
+        return 0
+    return int(size_in_bytes * 1000000000 / elapsed_nanos)
+
+
+def analyze_repository(module, client, name):
+    '''
+    Run the repository analysis api and summarise the throughput
+    '''
+    params = repository_arg(name)
+    params.update(module.params['analysis'])
+    response = dict(client.snapshot.repository_analyze(**params))
+    summary = response.get('summary', {})
+    write = summary.get('write', {})
+    read = summary.get('read', {})
+    return {
+        "blob_count": response.get('blob_count'),
+        "write_count": write.get('count', 0),
+        "write_bytes": write.get('total_size_bytes', 0),
+        "write_bytes_per_sec": bytes_per_sec(write.get('total_size_bytes', 0), write.get('total_elapsed_nanos', 0)),
+        "read_count": read.get('count', 0),
+        "read_bytes": read.get('total_size_bytes', 0),
+        "read_bytes_per_sec": bytes_per_sec(read.get('total_size_bytes', 0), read.get('total_elapsed_nanos', 0)),
+        "listing_elapsed_ms": response.get('listing_elapsed_nanos', 0) // 1000000,
+        "delete_elapsed_ms": response.get('delete_elapsed_nanos', 0) // 1000000,
+        "issues_detected": response.get('issues_detected', []),
+    }
+
+
+def run_actions(module, client, name):
+    '''
+    Run the requested actions against the repository.
+    Only cleanup modifies the repository. Nothing is run in check mode.
+    '''
+    result = {}
+    changed = False
+    if module.check_mode:
+        return changed, result
+    for action in module.params['actions'] or []:
+        if action == "verify":
+            result['verified_nodes'] = verify_repository(client, name)
+        elif action == "cleanup":
+            result['cleanup'] = cleanup_repository(client, name)
+            if result['cleanup'].get('deleted_blobs', 0) > 0:
+                changed = True
+        elif action == "analyze":
+            result['analysis'] = analyze_repository(module, client, name)
+    return changed, result
+
+
 # ================
 # Module execution
 #
@@ -143,7 +370,18 @@ def main():
         type=dict(type='str', default='fs'),
         state=dict(type='str', choices=state_choices, default='present'),
         name=dict(type='str', required=True),
-        verify=dict(type='bool', default=True)
+        verify=dict(type='bool', default=True),
+        settings=dict(type='dict'),
+        max_snapshot_bytes_per_sec=dict(type='str'),
+        max_restore_bytes_per_sec=dict(type='str'),
+        actions=dict(type='list', elements='str', choices=['verify', 'cleanup', 'analyze']),
+        analysis=dict(type='dict', apply_defaults=True, options=dict(
+            blob_count=dict(type='int', default=10),
+            max_blob_size=dict(type='str', default='1mb'),
+            max_total_data_size=dict(type='str', default='10mb'),
+            concurrency=dict(type='int', default=10),
+            timeout=dict(type='str', default='30s'),
+        )),
     )
 
     module = AnsibleModule(
@@ -172,12 +410,23 @@ def main():
                     response = put_repository(module, client, name)
                 else:
                     response = {"aknowledged": True}
-                module.exit_json(changed=True, msg="The repository {0} was successfully created: {1}".format(name, str(response)))
+                changed, result = run_actions(module, client, name)
+                module.exit_json(changed=True, msg="The repository {0} was successfully created: {1}".format(name, str(response)), **result)
             elif state == "absent":
                 module.exit_json(changed=False, msg="The repository {0} does not exist.".format(name))
         else:
             if state == "present":
-                module.exit_json(changed=False, msg="The repository {0} already exists.".format(name))
+                differences = repository_differences(module, repository, name)
+                if differences:
+                    if module.check_mode is False:
+                        response = put_repository(module, client, name, repository)
+                    else:
+                        response = {"aknowledged": True}
+                changed, result = run_actions(module, client, name)
+                if differences:
+                    module.exit_json(changed=True, msg="The repository {0} was updated: {1}".format(name, str(response)),
+                                     differences=differences, **result)
+                module.exit_json(changed=changed, msg="The repository {0} already exists.".format(name), **result)
             elif state == "absent":
                 if module.check_mode is False:
                     name_arg = {('repository', 'name')[__version__ >= (8, 0, 0)]: name}
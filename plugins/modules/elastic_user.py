@@ -67,14 +67,74 @@ options:
     default: always
     choices: [always, on_create]
     description:
-      - C(always) will always update passwords and cause the module to return changed.
+      - C(always) will update the password of an existing user when it differs from I(password).
+        The password is checked by authenticating as the user, so disabled users always have their password updated.
       - C(on_create) will only set the password for newly created users.
     type: str
+  password_cache:
+    description:
+      - Path of a file on the managed host caching salted hashes of passwords verified for each host and user.
+      - When the supplied password matches the cached hash the authenticate request is skipped.
+      - A password changed outside of this module is not detected while its old value is cached.
+      - By default no cache is used.
+    type: path
   name:
     description:
       - Username of the user.
+      - Mutually exclusive with I(users).
     type: str
-    required: yes
+  users:
+    description:
+      - A list of users to manage in a single task.
+      - All users are fetched with one request and compared locally. Only users that
+        need to be created, updated or deleted are written.
+      - Each user supports the name, password, enabled, email, full_name, metadata, roles
+        and state options, with the same defaults as the top level options.
+      - I(update_password) applies to every user in the list.
+      - Mutually exclusive with I(name).
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - Username of the user.
+        type: str
+        required: true
+      password:
+        description:
+          - The user's password.
+        type: str
+      enabled:
+        description:
+          - Specifies whether the user is enabled.
+        type: bool
+        default: true
+      email:
+        description:
+          - The email of the user.
+        type: str
+      full_name:
+        description:
+          - The full name of the user.
+        type: str
+      metadata:
+        description:
+          - Arbitrary metadata that you want to associate with the user.
+        type: dict
+        default: {}
+      roles:
+        description:
+          - A set of roles the user has.
+        type: list
+        elements: str
+      state:
+        description:
+          - The desired state of the user.
+        type: str
+        choices:
+          - present
+          - absent
+        default: present
 
 '''
 
@@ -93,9 +153,40 @@ EXAMPLES = r'''
   community.elastic.elastic_user:
     username: rhysmeister
     state: absent
+
+- name: Manage many users in one task
+  community.elastic.elastic_user:
+    update_password: on_create
+    users:
+      - name: alice
+        password: s3cr3t
+        roles:
+          - reporting
+      - name: bob
+        password: s3cr3t
+        enabled: false
+        roles:
+          - reporting
+      - name: carol
+        state: absent
 '''
 
 RETURN = r'''
+created:
+  description: The names of the users created.
+  returned: when users is supplied
+  type: list
+  elements: str
+updated:
+  description: The names of the users updated.
+  returned: when users is supplied
+  type: list
+  elements: str
+deleted:
+  description: The names of the users deleted.
+  returned: when users is supplied
+  type: list
+  elements: str
 '''
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
@@ -108,7 +199,12 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    NotFoundError,
+    AuthenticationException,
+    salted_hash,
+    salted_hash_matches,
+    load_hash_file,
+    save_hash_file
 )
 
 
@@ -125,14 +221,79 @@ def get_user(module, client, name):
     return response
 
 
-def put_user(module, client, name, exists):
+def get_all_users(client):
+    '''
+    Uses the get user api to return all users in a single request
+    '''
+    return dict(client.security.get_user())
+
+
+def password_cache_key(module, name):
+    '''
+    Passwords are cached per host and user
+    '''
+    return "{0}:{1}/{2}".format(",".join(module.params['login_hosts']), module.params['login_port'], name)
+
+
+def load_password_cache(path):
+    '''
+    Load the password cache, None when no cache is used
+    '''
+    if path is None:
+        return None
+    return load_hash_file(path)
+
+
+def save_password_cache(module, path, cache):
+    '''
+    Write the password cache
+    '''
+    if cache is None or module.check_mode:
+        return
+    save_hash_file(path, cache)
+
+
+def cache_password(cache, key, password):
+    '''
+    Add a verified password to the cache
+    '''
+    if cache is None:
+        return
+    cache[key] = salted_hash(password)
+
+
+def password_is_different(module, elastic, name, password, cache):
+    '''
+    Check the password by authenticating as the user, unless it matches the cache
+    '''
+    key = password_cache_key(module, name)
+    if cache is not None and key in cache and salted_hash_matches(password, cache[key]):
+        return False
+    user_client = elastic.connect(credentials=(name, password))
+    try:
+        user_client.security.authenticate()
+    except AuthenticationException:
+        if cache is not None:
+            cache.pop(key, None)
+        return True
+    finally:
+        user_client.close()
+    cache_password(cache, key, password)
+    return False
+
+
+def put_user(module, client, name, exists, params=None, password_changed=True):
     '''
     Creates or updates a user
     @module - The Ansible module object
     @client - Elastic instance client
     @name - Username
     @exists - If the user already exists or not
+    @params - The user options, defaults to the module parameters
+    @password_changed - If the password of an existing user differs
     '''
+    if params is None:
+        params = module.params
     keys = [
         "enabled",
         "email",
@@ -147,13 +308,13 @@ def put_user(module, client, name, exists):
         # when the user already exists and
         # update_password = on_create
         if exists is True:
-            if module.params["update_password"] == "on_create":
+            if module.params["update_password"] == "on_create" or not password_changed:
                 keys.remove("password")
 
         body = {}
         for k in keys:
-            if module.params[k] is not None:
-                body[k] = module.params[k]
+            if params.get(k) is not None:
+                body[k] = params[k]
 
         response = dict(client.security.put_user(username=name, body=body))
         if not isinstance(response, dict):  # Valid response should be a dict
@@ -163,24 +324,28 @@ def put_user(module, client, name, exists):
     return response
 
 
-def user_is_different(current_user, module):
+def user_is_different(current_user, module, params=None):
     '''
     Check if user is different
     '''
-    name = module.params['name']
+    if params is None:
+        params = module.params
+    name = params['name']
     user = {
         name: {
-            "username": module.params['name'],
-            "roles": module.params['roles'] or [],
-            "enabled": module.params['enabled']
+            "username": params['name'],
+            "roles": params.get('roles') or [],
+            "enabled": params['enabled']
         }
     }
-    if module.params['full_name'] is not None:
-        user[name]['full_name'] = module.params['full_name']
-    if module.params['email'] is not None:
-        user[name]['email'] = module.params['email']
-    if module.params['metadata'] is not None:
-        user[name]['metadata'] = module.params['metadata']
+    if params.get('full_name') is not None:
+        user[name]['full_name'] = params['full_name']
+    if params.get('email') is not None:
+        user[name]['email'] = params['email']
+    if params.get('metadata') is not None:
+        user[name]['metadata'] = params['metadata']
+    # Elastic returns null for a full_name or email that is not set
+    current_user = dict((k, dict((a, v) for a, v in u.items() if v is not None)) for k, u in current_user.items())
     dict1 = json.dumps(current_user, sort_keys=True)
     dict2 = json.dumps(user, sort_keys=True)
     is_different = False
@@ -189,6 +354,47 @@ def user_is_different(current_user, module):
     return is_different
 
 
+def manage_users(module, elastic, client, cache):
+    '''
+    Fetch all users once, compare locally and only write the users that differ
+    '''
+    current_users = get_all_users(client)
+    update_password = module.params['update_password']
+    created = []
+    updated = []
+    deleted = []
+    for user in module.params['users']:
+        name = user['name']
+        current_user = current_users.get(name)
+        if user['state'] == "absent":
+            if current_user is not None:
+                if not module.check_mode:
+                    client.security.delete_user(username=name)
+                deleted.append(name)
+        elif current_user is None:
+            if not module.check_mode:
+                put_user(module, client, name, False, user)
+                if user['password'] is not None:
+                    cache_password(cache, password_cache_key(module, name), user['password'])
+            created.append(name)
+        else:
+            password_changed = update_password == "always" and user['password'] is not None \
+                and password_is_different(module, elastic, name, user['password'], cache)
+            if password_changed or user_is_different({name: current_user}, module, user):
+                if not module.check_mode:
+                    put_user(module, client, name, True, user, password_changed)
+                    if password_changed:
+                        cache_password(cache, password_cache_key(module, name), user['password'])
+                updated.append(name)
+    save_password_cache(module, module.params['password_cache'], cache)
+    changed = len(created + updated + deleted) > 0
+    module.exit_json(changed=changed,
+                     msg="{0} user(s) created, {1} updated and {2} deleted.".format(len(created), len(updated), len(deleted)),
+                     created=created,
+                     updated=updated,
+                     deleted=deleted)
+
+
 # ================
 # Module execution
 #
@@ -208,16 +414,29 @@ def main():
         metadata=dict(type='dict', default={}),
         password=dict(type='str', no_log=True),
         roles=dict(type='list', elements='str'),
-        name=dict(type='str', required=True),
+        name=dict(type='str'),
+        users=dict(type='list', elements='dict', options=dict(
+            name=dict(type='str', required=True),
+            password=dict(type='str', no_log=True),
+            enabled=dict(type='bool', default=True),
+            email=dict(type='str'),
+            full_name=dict(type='str'),
+            metadata=dict(type='dict', default={}),
+            roles=dict(type='list', elements='str'),
+            state=dict(type='str', choices=state_choices, default='present'),
+        )),
         run_as=dict(type='list', elements='str'),
         state=dict(type='str', choices=state_choices, default='present'),
-        update_password=dict(type='str', choices=['always', 'on_create'], default='always', no_log=True)
+        update_password=dict(type='str', choices=['always', 'on_create'], default='always', no_log=True),
+        password_cache=dict(type='path', no_log=False),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
         required_together=[['login_user', 'login_password']],
+        required_one_of=[['name', 'users']],
+        mutually_exclusive=[['name', 'users']],
     )
 
     if not elastic_found:
@@ -227,11 +446,17 @@ def main():
     name = module.params['name']
     state = module.params['state']
     update_password = module.params['update_password']
+    password = module.params['password']
+    password_cache = module.params['password_cache']
+    cache = load_password_cache(password_cache)
 
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
+        if module.params['users'] is not None:
+            manage_users(module, elastic, client, cache)
+
         user = get_user(module, client, name)
         response = None
 
@@ -239,16 +464,25 @@ def main():
             if state == "present":
                 if module.check_mode is False:
                     response = put_user(module, client, name, False)
+                    if password is not None:
+                        cache_password(cache, password_cache_key(module, name), password)
+                        save_password_cache(module, password_cache, cache)
                 module.exit_json(changed=True, msg="The user {0} was successfully created: {1}".format(name, str(response)))
             elif state == "absent":
                 module.exit_json(changed=False, msg="The user {0} does not exist.".format(name))
         else:
             if state == "present":
-                if user_is_different(user, module) or update_password == "always":
+                password_changed = update_password == "always" and password is not None \
+                    and password_is_different(module, elastic, name, password, cache)
+                if password_changed or user_is_different(user, module):
                     if module.check_mode is False:
-                        response = put_user(module, client, name, True)
+                        response = put_user(module, client, name, True, password_changed=password_changed)
+                        if password_changed:
+                            cache_password(cache, password_cache_key(module, name), password)
+                    save_password_cache(module, password_cache, cache)
                     module.exit_json(changed=True, msg="The user {0} was successfully updated: {1} {2}".format(name, str(response), str(user)))
                 else:
+                    save_password_cache(module, password_cache, cache)
                     module.exit_json(changed=False, msg="The user {0} already exists as configured.".format(name))
             elif state == "absent":
                 if module.check_mode is False: